@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import math
+import time
+import random
+import platform
+import argparse
+import subprocess
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from polygon import Point, ConvexPolygon
+
+VERTICES: List[int] = [3, 10, 100, 1000, 10000, 100000]
+BATCHES: List[int] = [1, 100, 10000, 1000000, 10000000]
+DISTRIBUTIONS: List[str] = ['inside', 'outside', 'boundary']
+#Maximum time in seconds of importing polygon in a new interpreter
+IMPORT_TIME_BUDGET: float = 0.3
+
+
+def regular_polygon(num_of_vertices: int) -> List[Point]:
+    '''
+    Returns shuffled points of regular polygon with radius 1 around (0, 0), so construction has to sort them.
+    '''
+    points: List[Point] = [
+        Point(math.cos(2 * math.pi * i / num_of_vertices), math.sin(2 * math.pi * i / num_of_vertices))
+        for i in range(num_of_vertices)
+    ]
+    random.shuffle(points)
+
+    return points
+
+
+def sample_points(polygon: ConvexPolygon, num_of_points: int, distribution: str, rng: np.random.Generator) -> np.ndarray:
+    '''
+    Returns (N, 2) array of points inside of regular polygon, outside of it or on its edges.
+    '''
+    if distribution == 'boundary':
+        coords: np.ndarray = np.array([(p.x, p.y) for p in polygon.points])
+        edge: np.ndarray = rng.integers(0, len(coords), num_of_points)
+        t: np.ndarray = rng.random((num_of_points, 1))
+
+        return coords[edge] * (1 - t) + coords[(edge + 1) % len(coords)] * t
+
+    #Inside points are in the circle inscribed in polygon, outside points are in the ring around polygon
+    inner_radius: float = math.cos(math.pi / len(polygon.points))
+    low, high = (0.0, 0.99 * inner_radius) if distribution == 'inside' else (1.01, 2.0)
+    radius: np.ndarray = np.sqrt(rng.uniform(low ** 2, high ** 2, num_of_points))
+    angle: np.ndarray = rng.uniform(0.0, 2 * math.pi, num_of_points)
+
+    return np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    '''
+    Returns the best time in seconds of repeated calls of function.
+    '''
+    best: float = math.inf
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def import_time(repeat: int = 3) -> float:
+    '''
+    Returns the best time in seconds of importing polygon in a new interpreter, so modules imported by this
+    process don't make it faster.
+    '''
+    code: str = 'import time; start = time.perf_counter(); import polygon; print(time.perf_counter() - start)'
+    directory: str = os.path.dirname(os.path.abspath(__file__))
+
+    return min(
+        float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=directory).stdout)
+        for _ in range(repeat)
+    )
+
+
+def run(vertices: List[int], batches: List[int], repeat: int = 3, max_loop_points: int = 100000, max_work: float = 1e10, seed: int = 0) -> List[Dict]:
+    '''
+    Runs benchmarks and returns list of results. Construction is measured for every number of vertices, contains
+    (one point per call) and contains_many (all points in one call) for every number of vertices, batch size and
+    distribution of points. Cases where contains would be called more than max_loop_points times, or where number of
+    vertices times number of points is larger than max_work, are skipped.
+
+        Parameters:
+            vertices: List[int]
+                numbers of vertices of polygon.
+            batches: List[int]
+                numbers of points to check.
+            repeat: int
+                number of runs, the best one is kept.
+            max_loop_points: int
+                maximum number of points checked with contains.
+            max_work: float
+                maximum number of vertices times number of points.
+            seed: int
+                seed for polygon and points, so every run uses the same data.
+
+        Returns:
+            List[Dict]:
+                results, every result has name, parameters and seconds.
+    '''
+    random.seed(seed)
+    rng: np.random.Generator = np.random.default_rng(seed)
+    results: List[Dict] = []
+
+    for num_of_vertices in vertices:
+        points: List[Point] = regular_polygon(num_of_vertices)
+        results.append({'name': 'construct', 'vertices': num_of_vertices, 'seconds': measure(lambda: ConvexPolygon(points), repeat)})
+        polygon: ConvexPolygon = ConvexPolygon(points)
+
+        for num_of_points in batches:
+            if num_of_vertices * num_of_points > max_work:
+                continue
+
+            for distribution in DISTRIBUTIONS:
+                coords: np.ndarray = sample_points(polygon, num_of_points, distribution, rng)
+                case: Dict = {'vertices': num_of_vertices, 'points': num_of_points, 'distribution': distribution}
+
+                results.append(dict(case, name='contains_many', seconds=measure(lambda: polygon.contains_many(coords), repeat)))
+
+                if num_of_points <= max_loop_points:
+                    query: List[Point] = [Point(x, y) for x, y in coords.tolist()]
+                    results.append(dict(case, name='contains', seconds=measure(lambda: [polygon.contains(p) for p in query], repeat)))
+
+    return results
+
+
+def _key(result: Dict) -> Tuple:
+    return (result['name'], result['vertices'], result.get('points'), result.get('distribution'))
+
+
+def compare(baseline: List[Dict], results: List[Dict], threshold: float) -> List[Tuple[Dict, float]]:
+    '''
+    Returns results that are slower than the same case in baseline by more than threshold, with the slowdown ratio.
+
+        Parameters:
+            baseline: List[Dict]
+                results of an earlier run.
+            results: List[Dict]
+                results of this run.
+            threshold: float
+                allowed slowdown, 0.2 allows 20% slower results.
+
+        Returns:
+            List[Tuple[Dict, float]]:
+                slower results and ratio of their time and baseline time.
+    '''
+    old: Dict[Tuple, float] = {_key(r): r['seconds'] for r in baseline}
+    slower: List[Tuple[Dict, float]] = []
+
+    for result in results:
+        old_seconds: Optional[float] = old.get(_key(result))
+
+        if old_seconds and result['seconds'] > old_seconds * (1 + threshold):
+            slower.append((result, result['seconds'] / old_seconds))
+
+    return slower
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark ConvexPolygon construction and queries.')
+    parser.add_argument('-o', '--output', help='JSON file for results')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON file with results of an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown compared to baseline, default 0.2 (20%%)')
+    parser.add_argument('--vertices', type=int, nargs='+', default=VERTICES, help='numbers of vertices of polygon')
+    parser.add_argument('--batches', type=int, nargs='+', default=BATCHES, help='numbers of points to check')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs, the best one is kept')
+    parser.add_argument('--max-loop-points', type=int, default=100000, help='maximum number of points checked one by one with contains')
+    parser.add_argument('--max-work', type=float, default=1e10, help='skip cases where vertices times points is larger')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_TIME_BUDGET, help='maximum time in seconds of importing polygon, default 0.3')
+    parser.add_argument('--quick', action='store_true', help='small sweep for a fast check')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.vertices = [3, 100, 10000]
+        args.batches = [1, 1000, 100000]
+
+    results: List[Dict] = run(args.vertices, args.batches, args.repeat, args.max_loop_points, args.max_work)
+
+    for r in results:
+        case: str = f'{r["name"]:<14} vertices={r["vertices"]:<7}'
+        if 'points' in r:
+            case += f' points={r["points"]:<9} {r["distribution"]:<9}'
+
+        print(f'{case} {r["seconds"]:.6f} s')
+
+    seconds: float = import_time(args.repeat)
+    print(f'{"import":<14} {seconds:.6f} s')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'commit': _commit(), 'python': platform.python_version(), 'import_seconds': seconds, 'results': results}, f, indent=2)
+
+    if seconds > args.import_budget:
+        print(f'SLOWER IMPORT: {seconds:.3f} s, budget is {args.import_budget:.3f} s')
+        sys.exit(1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline: List[Dict] = json.load(f)['results']
+
+        slower: List[Tuple[Dict, float]] = compare(baseline, results, args.threshold)
+
+        for r, ratio in slower:
+            print(f'SLOWER {ratio:.2f}x: {r["name"]} vertices={r["vertices"]} points={r.get("points")} {r.get("distribution", "")}'.rstrip())
+
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import unittest
+from benchmark import run, compare, import_time
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_benchmark_run(self):
+        results = run([3, 50], [10], repeat=1, max_loop_points=10, max_work=100)
+        cases = [(r['name'], r['vertices'], r.get('points'), r.get('distribution')) for r in results]
+
+        self.assertEqual(cases, [
+            ('construct', 3, None, None),
+            ('contains_many', 3, 10, 'inside'),
+            ('contains', 3, 10, 'inside'),
+            ('contains_many', 3, 10, 'outside'),
+            ('contains', 3, 10, 'outside'),
+            ('contains_many', 3, 10, 'boundary'),
+            ('contains', 3, 10, 'boundary'),
+            ('construct', 50, None, None)
+        ])
+
+    def test_benchmark_compare(self):
+        baseline = [{'name': 'construct', 'vertices': 3, 'seconds': 1.0}, {'name': 'construct', 'vertices': 10, 'seconds': 1.0}]
+        results = [{'name': 'construct', 'vertices': 3, 'seconds': 1.1}, {'name': 'construct', 'vertices': 10, 'seconds': 1.5}]
+
+        self.assertEqual(compare(baseline, results, 0.2), [(results[1], 1.5)])
+
+    def test_benchmark_import_time(self):
+        self.assertGreater(import_time(repeat=1), 0.0)
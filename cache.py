@@ -0,0 +1,162 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from polygon import Point, ConvexPolygon
+
+
+class ContainsCache:
+    '''
+    A class to represent a cache of results of ConvexPolygon.contains with least recently used eviction. Results
+    are keyed on version of polygon and coordinates of point, so replacing points of polygon makes its old results
+    unreachable and they are evicted with time. Cache can be shared between threads.
+
+        Properties:
+
+            maxsize: int
+                maximum number of cached results.
+            ttl: Optional[float]
+                number of seconds a result stays valid, results don't expire if None.
+            quantum: Optional[float]
+                size of the grid coordinates are rounded to before lookup, coordinates are used as they are if None.
+
+        Methods:
+
+            contains(polygon: ConvexPolygon, point: Point):
+                returns if polygon contains point or not, using cached result if there is one.
+
+            stats():
+                returns number of hits, misses, evictions and cached results.
+
+            clear():
+                removes all cached results and resets statistics.
+    '''
+    def __init__(self, maxsize: int = 100000, ttl: Optional[float] = None, quantum: Optional[float] = None) -> None:
+        '''
+        Constructs an empty cache.
+
+            Parameters:
+                maxsize: int
+                    maximum number of cached results.
+                ttl: Optional[float]
+                    number of seconds a result stays valid, results don't expire if None.
+                quantum: Optional[float]
+                    size of the grid coordinates are rounded to. Points in the same grid cell share one result,
+                    so results are approximate near the edges of polygon.
+        '''
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError('Maximum size must be 1 or greater!')
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError('Time to live must be greater than 0!')
+
+        if quantum is not None and quantum <= 0:
+            raise ValueError('Quantum must be greater than 0!')
+
+        self._maxsize: int = maxsize
+        self._ttl: Optional[float] = ttl
+        self._quantum: Optional[float] = quantum
+
+        #Key is (polygon version, x, y), value is (result, expiration time)
+        self._results: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    #Getters
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def quantum(self) -> Optional[float]:
+        return self._quantum
+
+
+    def _key(self, polygon: ConvexPolygon, point: Point) -> Tuple:
+        if self._quantum is None:
+            return (polygon.version, point.x, point.y)
+
+        return (polygon.version, round(point.x / self._quantum), round(point.y / self._quantum))
+
+
+    def contains(self, polygon: ConvexPolygon, point: Point) -> bool:
+        '''
+        Returns if polygon contains provided point or not. Result is calculated with ConvexPolygon.contains and
+        cached if it is not already cached or it expired.
+
+            Parameters:
+                polygon: ConvexPolygon
+                    polygon to check.
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        if not isinstance(polygon, ConvexPolygon) or not isinstance(point, Point):
+            raise TypeError('Expected arguments type: ConvexPolygon, Point')
+
+        key: Tuple = self._key(polygon, point)
+        now: float = time.monotonic()
+
+        with self._lock:
+            cached: Optional[Tuple[bool, float]] = self._results.get(key)
+
+            if cached is not None and cached[1] > now:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return cached[0]
+
+            self._misses += 1
+
+        #Polygon is checked outside of the lock so other threads are not blocked
+        result: bool = polygon.contains(point)
+        expires: float = now + self._ttl if self._ttl is not None else float('inf')
+
+        with self._lock:
+            self._results[key] = (result, expires)
+            self._results.move_to_end(key)
+
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+                self._evictions += 1
+
+        return result
+
+
+    def stats(self) -> Dict[str, float]:
+        '''
+        Returns number of hits, misses, evictions and cached results and ratio of hits to all lookups.
+
+            Returns:
+                Dict[str, float]:
+                    statistics of the cache.
+        '''
+        with self._lock:
+            lookups: int = self._hits + self._misses
+
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._results),
+                'hit_rate': self._hits / lookups if lookups else 0.0
+            }
+
+
+    def clear(self) -> None:
+        '''
+        Removes all cached results and resets statistics.
+        '''
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
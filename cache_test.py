@@ -0,0 +1,73 @@
+import time
+import random
+import unittest
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from cache import ContainsCache
+
+
+class ContainsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.polygon = ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)])
+
+    def test_contains_cache_hits(self):
+        cache = ContainsCache()
+
+        self.assertEqual([cache.contains(self.polygon, Point(1.0, 1.0)) for _ in range(3)], [True, True, True])
+        self.assertEqual(cache.contains(self.polygon, Point(11.0, 1.0)), False)
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 2, 'evictions': 0, 'size': 2, 'hit_rate': 0.5})
+
+    def test_contains_cache_lru(self):
+        cache = ContainsCache(maxsize=2)
+        cache.contains(self.polygon, Point(1.0, 1.0))
+        cache.contains(self.polygon, Point(2.0, 2.0))
+        cache.contains(self.polygon, Point(1.0, 1.0))
+        cache.contains(self.polygon, Point(3.0, 3.0))
+        cache.contains(self.polygon, Point(1.0, 1.0))
+
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.stats()['hits'], 2)
+
+    def test_contains_cache_points_replaced(self):
+        cache = ContainsCache()
+        cache.contains(self.polygon, Point(1.0, 1.0))
+        self.polygon.points = [Point(5.0, 5.0), Point(10.0, 5.0), Point(10.0, 10.0)]
+
+        self.assertEqual(cache.contains(self.polygon, Point(1.0, 1.0)), False)
+        self.assertEqual(cache.stats()['hits'], 0)
+
+    def test_contains_cache_ttl(self):
+        cache = ContainsCache(ttl=0.01)
+        cache.contains(self.polygon, Point(1.0, 1.0))
+        time.sleep(0.02)
+        cache.contains(self.polygon, Point(1.0, 1.0))
+
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_contains_cache_quantum(self):
+        cache = ContainsCache(quantum=0.1)
+        cache.contains(self.polygon, Point(1.0, 1.0))
+        cache.contains(self.polygon, Point(1.01, 0.99))
+
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_contains_cache_threads(self):
+        random.seed(14)
+        cache = ContainsCache(maxsize=50)
+        points = [Point(float(random.randint(-5, 15)), float(random.randint(-5, 15))) for _ in range(2000)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda p: cache.contains(self.polygon, p), points))
+
+        self.assertEqual(results, [self.polygon.contains(p) for p in points])
+        self.assertEqual(cache.stats()['hits'] + cache.stats()['misses'], 2000)
+        self.assertLessEqual(cache.stats()['size'], 50)
+
+    def test_contains_cache_bad_size(self):
+        with pytest.raises(ValueError, match='Maximum size must be 1 or greater!'):
+            ContainsCache(maxsize=0)
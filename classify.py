@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from itertools import islice
+from typing import Iterator, List, Optional, TextIO
+from polygon import Point, ConvexPolygon
+from polygon_index import PolygonIndex
+
+
+def read_polygons(path: str) -> List[ConvexPolygon]:
+    '''
+    Returns polygons read from JSON file. File contains a list of polygons, every polygon is a list of [x, y] points.
+
+        Parameters:
+            path: str
+                path to JSON file.
+
+        Returns:
+            List[ConvexPolygon]:
+                list of polygons.
+    '''
+    with open(path) as f:
+        data = json.load(f)
+
+    if not isinstance(data, list) or not data:
+        raise ValueError('Expected a non-empty list of polygons')
+
+    return [ConvexPolygon([Point(float(x), float(y)) for x, y in polygon]) for polygon in data]
+
+
+def _parse_line(line: str, fmt: str) -> Optional[List[float]]:
+    '''
+    Returns x and y coordinates from a line of input or None if line is empty.
+    '''
+    line = line.strip()
+
+    if not line:
+        return None
+
+    if fmt == 'ndjson':
+        value = json.loads(line)
+
+        if isinstance(value, dict):
+            return [float(value['x']), float(value['y'])]
+
+        return [float(value[0]), float(value[1])]
+
+    x, y = line.split(',')[:2]
+
+    return [float(x), float(y)]
+
+
+def read_chunks(stream: TextIO, fmt: str, chunk_size: int) -> Iterator[np.ndarray]:
+    '''
+    Yields points read from stream in (N, 2) arrays of at most chunk_size points. Only one chunk is kept in memory.
+    CSV lines are 'x,y' and the first line is skipped if it is a header. NDJSON lines are {"x": x, "y": y} or [x, y].
+
+        Parameters:
+            stream: TextIO
+                stream of points.
+            fmt: str
+                format of stream, 'csv' or 'ndjson'.
+            chunk_size: int
+                maximum number of points in chunk.
+
+        Returns:
+            Iterator[np.ndarray]:
+                chunks of points.
+    '''
+    line_number: int = 0
+
+    while True:
+        lines: List[str] = list(islice(stream, chunk_size))
+
+        if not lines:
+            return
+
+        coords: List[List[float]] = []
+        for line in lines:
+            line_number += 1
+
+            try:
+                point: Optional[List[float]] = _parse_line(line, fmt)
+            except (ValueError, KeyError, IndexError, TypeError):
+                #First line of CSV file can be a header
+                if fmt == 'csv' and line_number == 1:
+                    continue
+
+                raise ValueError(f'Invalid point on line {line_number}: {line.strip()}')
+
+            if point is not None:
+                coords.append(point)
+
+        yield np.array(coords, dtype=float).reshape(-1, 2)
+
+
+def write_chunk(stream: TextIO, fmt: str, coords: np.ndarray, result: List[List[int]]) -> None:
+    '''
+    Writes indices of polygons that contain every point of chunk.
+
+        Parameters:
+            stream: TextIO
+                output stream.
+            fmt: str
+                format of output, 'csv' or 'ndjson'.
+            coords: np.ndarray
+                (N, 2) array of points.
+            result: List[List[int]]
+                indices of polygons that contain point, for every point.
+    '''
+    if fmt == 'ndjson':
+        lines: List[str] = [json.dumps({'x': x, 'y': y, 'polygons': r}) for (x, y), r in zip(coords.tolist(), result)]
+    else:
+        lines = [f'{x!r},{y!r},{";".join(map(str, r))}' for (x, y), r in zip(coords.tolist(), result)]
+
+    if lines:
+        stream.write('\n'.join(lines) + '\n')
+
+
+def classify(polygons: List[ConvexPolygon], source: TextIO, output: TextIO, fmt: str = 'csv', out_fmt: Optional[str] = None, chunk_size: int = 100000) -> int:
+    '''
+    Classifies points from source against polygons chunk by chunk and writes results to output.
+
+        Parameters:
+            polygons: List[ConvexPolygon]
+                list of polygons.
+            source: TextIO
+                stream of points.
+            output: TextIO
+                output stream.
+            fmt: str
+                format of source, 'csv' or 'ndjson'.
+            out_fmt: Optional[str]
+                format of output, same as fmt if not provided.
+            chunk_size: int
+                number of points read, classified and written at once.
+
+        Returns:
+            int:
+                number of classified points.
+    '''
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be 1 or greater!')
+
+    index: PolygonIndex = PolygonIndex(polygons)
+    count: int = 0
+
+    for coords in read_chunks(source, fmt, chunk_size):
+        write_chunk(output, out_fmt or fmt, coords, index.query_many(coords))
+        count += coords.shape[0]
+
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Classify points against convex polygons without user input.')
+    parser.add_argument('polygons', help='JSON file with a list of polygons, every polygon is a list of [x, y] points')
+    parser.add_argument('points', nargs='?', help='CSV or NDJSON file with points, stdin if not provided')
+    parser.add_argument('--format', choices=['csv', 'ndjson'], help='format of points, guessed from file extension if not provided')
+    parser.add_argument('--output-format', choices=['csv', 'ndjson'], help='format of results, same as points if not provided')
+    parser.add_argument('-o', '--output', help='file for results, stdout if not provided')
+    parser.add_argument('--chunk-size', type=int, default=100000, help='number of points processed at once')
+    args = parser.parse_args(argv)
+
+    fmt: str = args.format or ('ndjson' if args.points and args.points.endswith(('.ndjson', '.jsonl')) else 'csv')
+
+    source: TextIO = sys.stdin
+    output: TextIO = sys.stdout
+
+    try:
+        if args.points:
+            source = open(args.points)
+        if args.output:
+            output = open(args.output, 'w')
+
+        polygons: List[ConvexPolygon] = read_polygons(args.polygons)
+
+        start: float = time.perf_counter()
+        count: int = classify(polygons, source, output, fmt, args.output_format, args.chunk_size)
+        elapsed: float = time.perf_counter() - start
+
+    #Missing files, invalid polygons or points
+    except (OSError, ValueError, TypeError) as e:
+        sys.exit(f'Error: {e}')
+
+    #Exit program on control-c
+    except KeyboardInterrupt:
+        sys.exit()
+
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f'Classified {count} points in {elapsed:.3f} s ({count / elapsed if elapsed else 0:.0f} points/s)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import io
+import sys
+import json
+import subprocess
+import unittest
+import pytest
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from classify import classify, main
+
+
+class ClassifyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.polygons = [
+            ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)]),
+            ConvexPolygon([Point(5.0, 5.0), Point(15.0, 5.0), Point(15.0, 15.0)])
+        ]
+
+    def test_classify_csv(self):
+        source = io.StringIO('x,y\n1.0,1.0\n9.0,6.0\n\n20.0,20.0\n')
+        output = io.StringIO()
+
+        self.assertEqual(classify(self.polygons, source, output, chunk_size=2), 3)
+        self.assertEqual(output.getvalue(), '1.0,1.0,0\n9.0,6.0,0;1\n20.0,20.0,\n')
+
+    def test_classify_ndjson(self):
+        source = io.StringIO('{"x": 1.0, "y": 1.0}\n[12.0, 6.0]\n')
+        output = io.StringIO()
+        classify(self.polygons, source, output, 'ndjson')
+
+        self.assertEqual([json.loads(line)['polygons'] for line in output.getvalue().splitlines()], [[0], [1]])
+
+    def test_classify_invalid_point(self):
+        source = io.StringIO('1.0,1.0\n1.0,a\n')
+
+        with pytest.raises(ValueError, match='Invalid point on line 2: 1.0,a'):
+            classify(self.polygons, source, io.StringIO())
+
+    def test_classify_main(self):
+        polygons_file = self.tmp_path / 'polygons.json'
+        points_file = self.tmp_path / 'points.csv'
+        output_file = self.tmp_path / 'output.ndjson'
+        polygons_file.write_text('[[[0, 0], [4, 0], [0, 4]]]')
+        points_file.write_text('1,1\n5,5\n')
+        main([str(polygons_file), str(points_file), '-o', str(output_file), '--output-format', 'ndjson'])
+
+        self.assertEqual([json.loads(line)['polygons'] for line in output_file.read_text().splitlines()], [[0], []])
+
+    def test_classify_main_repeated_point(self):
+        polygons_file = self.tmp_path / 'polygons.json'
+        points_file = self.tmp_path / 'points.csv'
+        polygons_file.write_text('[[[0, 0], [1, 0], [1, 0], [0, 1]]]')
+        points_file.write_text('1,1\n')
+
+        with pytest.raises(SystemExit, match='Error: Polygon is not convex!'):
+            main([str(polygons_file), str(points_file)])
+
+    def test_classify_no_matplotlib(self):
+        code = 'import sys, classify; sys.exit("matplotlib" in sys.modules)'
+
+        self.assertEqual(subprocess.run([sys.executable, '-c', code]).returncode, 0)
+
+    @pytest.fixture(autouse=True)
+    def _tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
@@ -0,0 +1,216 @@
+from __future__ import annotations
+import math
+import numpy as np
+from typing import Dict, Tuple, Union
+from polygon import Point, ConvexPolygon, as_coordinates, OUTSIDE, INSIDE, BOUNDARY
+from prepared import PreparedPolygon
+
+#Tolerance in cell units, cells this close to an edge are marked as boundary so rounding can't skip them.
+#It grows with size of coordinates compared to size of cells, because rounding errors grow with them too
+_EPS: float = 1e-9
+
+
+class PolygonGrid:
+    '''
+    A class to represent a raster grid over the bounding box of convex polygon. Every cell is marked as fully inside,
+    fully outside or boundary, so most points are checked with a single lookup and only points in boundary cells
+    are checked exactly, with the same logic as ConvexPolygon.contains. Grid is built from the points polygon has
+    when grid is created.
+
+        Properties:
+
+            shape: Tuple[int, int]
+                number of cells along x and y axis.
+            nbytes: int
+                memory used by cells in bytes.
+            cell_counts: Dict[str, int]
+                number of inside, outside and boundary cells.
+
+        Methods:
+
+            contains(point: Point):
+                returns if polygon contains point or not.
+
+            contains_many(xs, ys):
+                returns boolean mask of which points polygon contains.
+    '''
+    def __init__(self, polygon: ConvexPolygon, resolution: Union[int, Tuple[int, int]] = 256) -> None:
+        '''
+        Builds the grid. Cells crossed by an edge of polygon are boundary cells, other cells are inside or outside
+        depending on their center.
+
+            Parameters:
+                polygon: ConvexPolygon
+                    polygon to build the grid for.
+                resolution: Union[int, Tuple[int, int]]
+                    number of cells along the longer side of bounding box, or number of cells along x and y axis.
+                    Grid uses one byte per cell.
+        '''
+        if not isinstance(polygon, ConvexPolygon):
+            raise TypeError('Expected an argument type: ConvexPolygon')
+
+        self._prepared: PreparedPolygon = polygon.prepare()
+        min_x, min_y, max_x, max_y = self._bounds = polygon.bounds
+
+        if isinstance(resolution, int):
+            if resolution < 1:
+                raise ValueError('Resolution must be 1 or greater!')
+
+            longer: float = max(max_x - min_x, max_y - min_y)
+            resolution = (
+                max(1, math.ceil(resolution * (max_x - min_x) / longer)),
+                max(1, math.ceil(resolution * (max_y - min_y) / longer))
+            )
+
+        nx, ny = resolution
+        if not isinstance(nx, int) or not isinstance(ny, int) or nx < 1 or ny < 1:
+            raise ValueError('Resolution must be 1 or greater!')
+
+        self._shape: Tuple[int, int] = (nx, ny)
+        self._cell_w: float = (max_x - min_x) / nx
+        self._cell_h: float = (max_y - min_y) / ny
+
+        self._eps: float = _EPS + 1e-12 * max(abs(c) for c in self._bounds) / min(self._cell_w, self._cell_h)
+
+        cells: np.ndarray = np.full((ny, nx), OUTSIDE, dtype=np.uint8)
+        self._mark_boundary(cells, polygon)
+
+        #Cells that no edge crosses are whole inside or whole outside of polygon, their center tells which one
+        rows, cols = np.nonzero(cells != BOUNDARY)
+        centers_x: np.ndarray = min_x + (cols + 0.5) * self._cell_w
+        centers_y: np.ndarray = min_y + (rows + 0.5) * self._cell_h
+        inside: np.ndarray = self._prepared.contains_many(centers_x, centers_y)
+        cells[rows[inside], cols[inside]] = INSIDE
+
+        #Bytearray gives fast lookups of single cells and shares memory with the array used for batches
+        self._cells: bytearray = bytearray(cells.tobytes())
+        self._np_cells: np.ndarray = np.frombuffer(self._cells, dtype=np.uint8)
+
+    #Getters
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._cells)
+
+    @property
+    def cell_counts(self) -> Dict[str, int]:
+        counts: np.ndarray = np.bincount(self._np_cells, minlength=3)
+
+        return {'inside': int(counts[INSIDE]), 'outside': int(counts[OUTSIDE]), 'boundary': int(counts[BOUNDARY])}
+
+
+    def _mark_boundary(self, cells: np.ndarray, polygon: ConvexPolygon) -> None:
+        '''
+        Marks every cell crossed by an edge of polygon as boundary. Every edge is walked column by column and in each
+        column cells between the lowest and the highest y coordinate of the edge are marked.
+        '''
+        min_x, min_y = self._bounds[0], self._bounds[1]
+        nx, ny = self._shape
+        eps: float = self._eps
+        points = polygon.points
+
+        for i in range(len(points)):
+            #Edge in grid units
+            x1: float = (points[i].x - min_x) / self._cell_w
+            y1: float = (points[i].y - min_y) / self._cell_h
+            x2: float = (points[(i + 1) % len(points)].x - min_x) / self._cell_w
+            y2: float = (points[(i + 1) % len(points)].y - min_y) / self._cell_h
+
+            if x1 > x2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+
+            slope: float = (y2 - y1) / (x2 - x1) if x2 > x1 else 0.0
+
+            for col in range(max(0, math.floor(x1 - eps)), min(nx - 1, math.floor(x2 + eps)) + 1):
+                #Part of the edge inside of the column
+                start: float = min(max(x1, col), x2)
+                end: float = max(min(x2, col + 1), start)
+
+                if x2 > x1:
+                    low, high = sorted((y1 + (start - x1) * slope, y1 + (end - x1) * slope))
+                else:
+                    low, high = sorted((y1, y2))
+
+                row_low: int = max(0, math.floor(low - eps))
+                row_high: int = min(ny - 1, math.floor(high + eps))
+                cells[row_low:row_high + 1, col] = BOUNDARY
+
+
+    def _cell_index(self, x: float, y: float) -> int:
+        '''
+        Returns index of the cell of point inside of bounding box. Points on the max side go to the last cell.
+        '''
+        nx, ny = self._shape
+        col: int = min(int((x - self._bounds[0]) / self._cell_w), nx - 1)
+        row: int = min(int((y - self._bounds[1]) / self._cell_h), ny - 1)
+
+        return row * nx + col
+
+
+    def contains(self, point: Point) -> bool:
+        '''
+        Returns if polygon contains provided point or not. Points on the edges of polygon are contained.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        x: float = point.x
+        y: float = point.y
+        min_x, min_y, max_x, max_y = self._bounds
+
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            return False
+
+        state: int = self._cells[self._cell_index(x, y)]
+
+        if state == BOUNDARY:
+            return self._prepared.contains_xy(x, y)
+
+        return state == INSIDE
+
+
+    def contains_many(self, xs, ys=None) -> np.ndarray:
+        '''
+        Returns boolean mask of which of provided points polygon contains. Cells of all points are looked up at once
+        and only points in boundary cells are checked exactly.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+
+            Returns:
+                np.ndarray:
+                    boolean mask, True where polygon contains point.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+        nx, ny = self._shape
+        min_x, min_y, max_x, max_y = self._bounds
+
+        mask: np.ndarray = np.zeros(xs.shape[0], dtype=bool)
+        candidates: np.ndarray = np.flatnonzero((xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y))
+        cand_x: np.ndarray = xs[candidates]
+        cand_y: np.ndarray = ys[candidates]
+
+        cols: np.ndarray = np.minimum(((cand_x - min_x) / self._cell_w).astype(np.intp), nx - 1)
+        rows: np.ndarray = np.minimum(((cand_y - min_y) / self._cell_h).astype(np.intp), ny - 1)
+        states: np.ndarray = self._np_cells[rows * nx + cols]
+
+        mask[candidates[states == INSIDE]] = True
+
+        boundary: np.ndarray = states == BOUNDARY
+        mask[candidates[boundary]] = self._prepared.contains_many(cand_x[boundary], cand_y[boundary])
+
+        return mask
@@ -0,0 +1,59 @@
+import math
+import random
+import unittest
+import pytest
+import numpy as np
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from grid import PolygonGrid
+
+
+class PolygonGridTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.polygon = ConvexPolygon.from_points_hull([Point(random.uniform(-50.0, 50.0), random.uniform(-20.0, 20.0)) for _ in range(100)])
+        self.coords = np.array([(random.uniform(-60.0, 60.0), random.uniform(-30.0, 30.0)) for _ in range(5000)])
+
+    def test_polygon_grid_shape(self):
+        grid = PolygonGrid(self.polygon, 64)
+
+        self.assertEqual(max(grid.shape), 64)
+        self.assertEqual(grid.nbytes, grid.shape[0] * grid.shape[1])
+        self.assertEqual(sum(grid.cell_counts.values()), grid.nbytes)
+
+    def test_polygon_grid_contains(self):
+        for resolution in (1, 7, 64, (200, 3)):
+            grid = PolygonGrid(self.polygon, resolution)
+            points = [Point(x, y) for x, y in self.coords.tolist()] + self.polygon.points
+
+            self.assertEqual([grid.contains(p) for p in points], [self.polygon.contains(p) for p in points])
+
+    def test_polygon_grid_contains_many(self):
+        grid = PolygonGrid(self.polygon, 64)
+
+        self.assertEqual(grid.contains_many(self.coords).tolist(), self.polygon.contains_many(self.coords).tolist())
+
+    def test_polygon_grid_cells_on_grid_lines(self):
+        grid = PolygonGrid(ConvexPolygon([Point(0.0, 0.0), Point(4.0, 0.0), Point(4.0, 4.0), Point(0.0, 4.0)]), 8)
+        points = [Point(x / 2, y / 2) for x in range(-1, 10) for y in range(-1, 10)]
+
+        self.assertEqual([grid.contains(p) for p in points], [min(p.x, p.y) >= 0 and max(p.x, p.y) <= 4 for p in points])
+
+    def test_polygon_grid_mostly_lookups(self):
+        polygon = ConvexPolygon([Point(100.0 * math.cos(2 * math.pi * i / 50), 100.0 * math.sin(2 * math.pi * i / 50)) for i in range(50)])
+        counts = PolygonGrid(polygon, 256).cell_counts
+
+        self.assertLess(counts['boundary'], 0.05 * sum(counts.values()))
+
+    def test_polygon_grid_bad_resolution(self):
+        with pytest.raises(ValueError, match='Resolution must be 1 or greater!'):
+            PolygonGrid(self.polygon, (0, 5))
+
+        with pytest.raises(ValueError, match='Resolution must be 1 or greater!'):
+            PolygonGrid(self.polygon, 0)
+
+        with pytest.raises(ValueError, match='Resolution must be 1 or greater!'):
+            PolygonGrid(self.polygon, -5)
@@ -0,0 +1,99 @@
+import os
+import numpy as np
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+from polygon import ConvexPolygon, as_coordinates
+
+#Polygons and views of shared buffers, set once in every worker process
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(polygons: List[ConvexPolygon], points_name: str, result_name: str, num_of_points: int) -> None:
+    '''
+    Attaches worker process to shared buffers of points and results and stores polygons, so they are sent to every
+    worker only once and not with every task.
+    '''
+    points_shm: SharedMemory = SharedMemory(name=points_name)
+    result_shm: SharedMemory = SharedMemory(name=result_name)
+
+    _worker_state['polygons'] = polygons
+    _worker_state['shm'] = (points_shm, result_shm)
+    _worker_state['points'] = np.ndarray((2, num_of_points), dtype=float, buffer=points_shm.buf)
+    _worker_state['result'] = np.ndarray((len(polygons), num_of_points), dtype=bool, buffer=result_shm.buf)
+
+
+def _classify_range(bounds: Tuple[int, int]) -> None:
+    '''
+    Classifies points from start to end against every polygon and writes results directly into shared buffer.
+    '''
+    start, end = bounds
+    points: np.ndarray = _worker_state['points']
+    result: np.ndarray = _worker_state['result']
+
+    for i, polygon in enumerate(_worker_state['polygons']):
+        result[i, start:end] = polygon.contains_many(points[0, start:end], points[1, start:end])
+
+
+def classify_parallel(polygons: List[ConvexPolygon], points, workers: Optional[int] = None, chunk_size: Optional[int] = None) -> np.ndarray:
+    '''
+    Returns which polygons contain which points, classified in a pool of worker processes. Coordinates are copied
+    once into shared memory and every worker writes its part of the result into a shared mask, so neither points nor
+    results are pickled. Result is the same as calling ConvexPolygon.contains_many for every polygon.
+
+        Parameters:
+            polygons: List[ConvexPolygon]
+                list of polygons.
+            points: array_like
+                (N, 2) array of points.
+            workers: Optional[int]
+                number of worker processes, number of CPUs if not provided.
+            chunk_size: Optional[int]
+                number of points in one task, points are split in 4 tasks per worker if not provided.
+
+        Returns:
+            np.ndarray:
+                boolean mask of shape (number of polygons, N), True where polygon contains point.
+    '''
+    if not isinstance(polygons, list) or not all(isinstance(p, ConvexPolygon) for p in polygons):
+        raise TypeError('Expected a value type: List[ConvexPolygon]')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError('Number of workers must be 1 or greater!')
+
+    xs, ys = as_coordinates(points)
+    num_of_points: int = xs.shape[0]
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-num_of_points // (4 * workers)))
+    elif chunk_size < 1:
+        raise ValueError('Chunk size must be 1 or greater!')
+
+    #Shared memory can't have size 0
+    points_shm: SharedMemory = SharedMemory(create=True, size=max(1, 2 * num_of_points * 8))
+    result_shm: SharedMemory = SharedMemory(create=True, size=max(1, len(polygons) * num_of_points))
+
+    try:
+        shared_points: np.ndarray = np.ndarray((2, num_of_points), dtype=float, buffer=points_shm.buf)
+        shared_points[0] = xs
+        shared_points[1] = ys
+
+        ranges: List[Tuple[int, int]] = [(start, min(start + chunk_size, num_of_points)) for start in range(0, num_of_points, chunk_size)]
+
+        with Pool(workers, initializer=_init_worker, initargs=(polygons, points_shm.name, result_shm.name, num_of_points)) as pool:
+            pool.map(_classify_range, ranges)
+
+        result: np.ndarray = np.ndarray((len(polygons), num_of_points), dtype=bool, buffer=result_shm.buf).copy()
+
+    finally:
+        #Views of the buffers need to be released before shared memory is closed
+        shared_points = None
+        points_shm.close()
+        points_shm.unlink()
+        result_shm.close()
+        result_shm.unlink()
+
+    return result
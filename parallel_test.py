@@ -0,0 +1,41 @@
+import random
+import unittest
+import pytest
+import numpy as np
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from parallel import classify_parallel
+
+
+class ParallelTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(10)
+        self.polygons = [
+            ConvexPolygon.from_points_hull([Point(random.uniform(-50.0, 50.0), random.uniform(-50.0, 50.0)) for _ in range(30)])
+            for _ in range(5)
+        ]
+        self.points = np.array([(random.uniform(-60.0, 60.0), random.uniform(-60.0, 60.0)) for _ in range(5000)])
+
+    def test_classify_parallel(self):
+        result = classify_parallel(self.polygons, self.points, workers=2, chunk_size=700)
+        expected = np.array([p.contains_many(self.points) for p in self.polygons])
+
+        self.assertEqual(result.shape, (5, 5000))
+        self.assertTrue(np.array_equal(result, expected))
+
+    def test_classify_parallel_no_points(self):
+        self.assertEqual(classify_parallel(self.polygons, np.empty((0, 2)), workers=2).shape, (5, 0))
+
+    def test_classify_parallel_not_polygons(self):
+        with pytest.raises(TypeError, match='Expected a value type: List\\[ConvexPolygon\\]'):
+            classify_parallel([1], self.points)
+
+    def test_classify_parallel_zero(self):
+        with pytest.raises(ValueError, match='Number of workers must be 1 or greater!'):
+            classify_parallel(self.polygons, self.points, workers=0)
+
+        with pytest.raises(ValueError, match='Chunk size must be 1 or greater!'):
+            classify_parallel(self.polygons, self.points, workers=1, chunk_size=0)
@@ -1,7 +1,106 @@
 from __future__ import annotations
-import matplotlib.pyplot as plt
+import numpy as np
 import math
-from typing import List, Tuple
+import itertools
+from array import array
+from fractions import Fraction
+from typing import Dict, Iterator, List, Optional, Tuple
+
+def as_coordinates(xs, ys=None) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Returns x and y coordinates of points as float arrays.
+
+        Parameters:
+            xs: array_like
+                x coordinates of points, or an (N, 2) array of points if ys is not provided.
+            ys: array_like
+                y coordinates of points.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                one-dimensional arrays of x and y coordinates.
+    '''
+    if ys is None:
+        coords: np.ndarray = np.asarray(xs, dtype=float)
+
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError('Expected an array of shape (N, 2)')
+
+        return coords[:, 0], coords[:, 1]
+
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+
+    if xs.ndim != 1 or xs.shape != ys.shape:
+        raise ValueError('Expected one-dimensional arrays of equal length')
+
+    return xs, ys
+
+
+#Results of ConvexPolygon.locate
+OUTSIDE: int = 0
+INSIDE: int = 1
+BOUNDARY: int = 2
+
+#Relative error bound of cross product calculated with floats (Shewchuk), if cross product is further from 0 than
+#this times sum of absolute values of its two products, its sign is correct
+_ORIENTATION_ERROR: float = (3.0 + 16.0 * 2.0 ** -53) * 2.0 ** -53
+
+
+def orientation(point1: Point, point2: Point, point3: Point) -> int:
+    '''
+    Returns exact sign of cross product of vectors point1 -> point2 and point1 -> point3, 1 if point3 is on the 'left'
+    side of line point1 -> point2, -1 if it is on the 'right' side and 0 if points are collinear. Cross product is
+    calculated with floats and it is calculated again with exact fractions only when it is too close to 0 for
+    its sign to be certain.
+
+        Parameters:
+            point1: Point
+                starting point of line.
+            point2: Point
+                ending point of line.
+            point3: Point
+                point to check.
+
+        Returns:
+            int:
+                sign of cross product.
+    '''
+    return _cross_sign(point1, point2, point1, point3)
+
+
+def _cross_sign(start1: Point, end1: Point, start2: Point, end2: Point) -> int:
+    '''
+    Returns exact sign of cross product of vectors start1 -> end1 and start2 -> end2. Every factor of cross product
+    is a single difference of coordinates, so the same error bound as in orientation applies.
+    '''
+    left: float = (end1.x - start1.x) * (end2.y - start2.y)
+    right: float = (end1.y - start1.y) * (end2.x - start2.x)
+    det: float = left - right
+
+    #If products have different signs, sign of their difference can't be wrong
+    if (left > 0 and right <= 0) or (left < 0 and right >= 0):
+        return 1 if det > 0 else -1
+
+    if left == 0 and right == 0:
+        return 0
+
+    bound: float = _ORIENTATION_ERROR * abs(left + right)
+    if det > bound:
+        return 1
+    if -det > bound:
+        return -1
+
+    #Floats are converted to fractions exactly, so exact cross product gives exact sign
+    exact: Fraction = (Fraction(end1.x) - Fraction(start1.x)) * (Fraction(end2.y) - Fraction(start2.y)) - \
+        (Fraction(end1.y) - Fraction(start1.y)) * (Fraction(end2.x) - Fraction(start2.x))
+
+    return (exact > 0) - (exact < 0)
+
+
+#Source of versions of polygons, every assignment of points gets a number no other polygon ever had
+_versions: Iterator[int] = itertools.count()
+
 
 class Vector:
     '''
@@ -23,6 +122,8 @@ class Vector:
         angle_between_vectors(vector1, vector2):
             returns angle between two vectros in radians.
     '''
+    __slots__ = ('_start', '_end', '_x', '_y')
+
     def __init__(self, start: Point, end: Point) -> None:
         '''
         Constructs all the necessery properties for the vector object and calculates vectors x and y components
@@ -38,6 +139,25 @@ class Vector:
         self.x = self.end.x - self.start.x
         self.y = self.end.y - self.start.y
 
+    @classmethod
+    def _make(cls, start: Point, end: Point) -> Vector:
+        '''
+        Constructs vector without type checks. Used inside the library for vectors between already validated points.
+
+            Parameters:
+                start: Point
+                    starting point of vector
+                end: Point
+                    ending point of vector
+        '''
+        vector: Vector = object.__new__(cls)
+        vector._start = start
+        vector._end = end
+        vector._x = end._x - start._x
+        vector._y = end._y - start._y
+
+        return vector
+
     #Getters and Setters
     @property
     def start(self) -> Point:
@@ -142,6 +262,8 @@ class Point:
             y: float
                 point y coordinate.
     '''
+    __slots__ = ('_x', '_y')
+
     def __init__(self, x: float, y: float) -> None:
         '''
         Constructs all the necessery properties for the point object.
@@ -155,6 +277,23 @@ class Point:
         self.x = x
         self.y = y
 
+    @classmethod
+    def _make(cls, x: float, y: float) -> Point:
+        '''
+        Constructs point without type checks. Used inside the library for points calculated from already validated points.
+
+            Parameters:
+                x: float
+                    point x coordinate.
+                y: float
+                    point y coordinate.
+        '''
+        point: Point = object.__new__(cls)
+        point._x = x
+        point._y = y
+
+        return point
+
     #Getters and Setters
     @property
     def x(self) -> float:
@@ -187,15 +326,74 @@ class ConvexPolygon:
 
             points: List[Point]
                 list of points of polygon.
+            bounds: Tuple[float, float, float, float]
+                bounding box of polygon (min x, min y, max x, max y).
+            count_tiers: bool
+                are queried points counted by the tier that resolved them, False by default.
+            tier_counts: Dict[str, int]
+                number of queried points resolved by bounding box, inner circle and edges, while count_tiers is True.
+            version: int
+                number that changes every time points are replaced, unique among all polygons.
 
         Methods:
 
+            from_points_hull(points: List[Point]):
+                returns convex hull of points.
+
+            from_xy(xs, ys):
+                returns polygon from arrays of x and y coordinates.
+
+            from_ragged(coords, offsets):
+                returns many polygons from one array of points.
+
             contains(point: Point):
                 returns if polygon contains point or not.
 
+            contains_many(xs, ys):
+                returns boolean mask of which points polygon contains.
+
+            locate(point: Point):
+                returns if point is inside of polygon, on its edge or outside of it, with exact arithmetic.
+
+            intersects(other: ConvexPolygon):
+                returns if polygons have a common point.
+
+            intersection(other: ConvexPolygon):
+                returns common part of polygons.
+
+            distance(point: Point, signed: bool):
+                returns distance from point to the edges of polygon.
+
+            nearest_boundary_point(point: Point):
+                returns point on the edges of polygon nearest to point.
+
+            distance_many(xs, ys, signed: bool):
+                returns distances from points to the edges of polygon.
+
+            nearest_boundary_point_many(xs, ys):
+                returns points on the edges of polygon nearest to points.
+
+            insert_vertex(point: Point):
+                adds point to polygon.
+
+            move_vertex(index: int, point: Point):
+                moves point of polygon to a new position.
+
+            remove_vertex(index: int):
+                removes point from polygon.
+
+            prepare():
+                returns immutable, query-optimized form of polygon.
+
+            tier_stats():
+                returns fraction of queried points resolved by bounding box, inner circle and edges.
+
             draw(points: Point, contains: bool):
                 plots polygon and provided point and writes does polygon contians point.
     '''
+    #Queries count resolving tiers only when enabled, so by default they don't write to polygon
+    _count_tiers: bool = False
+
     def __init__(self, points: List[Point]) -> None:
         '''
         Constructs all the necessery properties for the convex polygon object, sorts points in counterclockwise order
@@ -225,7 +423,263 @@ class ConvexPolygon:
         if len(value) < 3:
             raise ValueError('Number of points must be 3 or greater!')
 
-        self._points = self._sort_points(value)
+        self._set_points(self._sort_points(value))
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        return self._bounds
+
+
+    def _set_points(self, points: List[Point]) -> None:
+        '''
+        Stores already sorted points and precomputes data used by queries.
+
+            Parameters:
+                points: List[Point]
+                    counterclockwise sorted list of points.
+        '''
+        self._points = points
+        self._version = next(_versions)
+        self._bounds = (
+            min(p.x for p in points),
+            min(p.y for p in points),
+            max(p.x for p in points),
+            max(p.y for p in points)
+        )
+        self._build_fan()
+        self._build_edges()
+        self._build_inner_circle()
+
+        #Number of queries resolved by bounding box, inner circle and edges
+        self._tier_counts: List[int] = [0, 0, 0]
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def count_tiers(self) -> bool:
+        return self._count_tiers
+
+    @count_tiers.setter
+    def count_tiers(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError('Expected a value type: bool')
+
+        self._count_tiers = value
+
+    @property
+    def tier_counts(self) -> Dict[str, int]:
+        return dict(zip(('bounding_box', 'inner_circle', 'edges'), self._tier_counts))
+
+
+    def tier_stats(self) -> Dict[str, float]:
+        '''
+        Returns fraction of queried points that were resolved by bounding box (rejected), inner circle (accepted)
+        and edges. Points are counted only while count_tiers is True, so queries don't write to polygon by default.
+        Counters are reset when points of polygon are replaced.
+
+            Returns:
+                Dict[str, float]:
+                    fraction of queries for every tier.
+        '''
+        queries: int = sum(self._tier_counts)
+
+        return {tier: count / queries if queries else 0.0 for tier, count in self.tier_counts.items()}
+
+
+    @classmethod
+    def from_points_hull(cls, points: List[Point]) -> ConvexPolygon:
+        '''
+        Returns polygon that is the convex hull of provided points, built with monotone chain algorithm in
+        O(n log n) time. Points inside of the hull and points on its edges are dropped. Hull is convex and
+        counterclockwise by construction so points are not sorted and convexity is not checked again.
+
+            Parameters:
+                points: List[Point]
+                    list of points.
+
+            Returns:
+                ConvexPolygon:
+                    convex hull of points.
+        '''
+        if not isinstance(points, list):
+            raise TypeError('Expected a value type: List[Point]')
+
+        if not all(isinstance(element, Point) for element in points):
+            raise TypeError('Expected type of an element of a list: Point')
+
+        #Sorting points by x and then by y coordinate
+        ordered: List[Point] = sorted(points, key=lambda p: (p.x, p.y))
+
+        def build_chain(chain_points: List[Point]) -> List[Point]:
+            chain: List[Point] = []
+
+            for p in chain_points:
+                #Remove last point while it doesn't make a counterclockwise turn, sign of the turn is exact so
+                #nearly collinear points can't leave a reflex vertex in the hull
+                while len(chain) >= 2 and orientation(chain[-2], chain[-1], p) <= 0:
+                    chain.pop()
+
+                chain.append(p)
+
+            return chain
+
+        lower: List[Point] = build_chain(ordered)
+        upper: List[Point] = build_chain(ordered[::-1])
+
+        #Last point of each chain is the first point of the other one
+        hull: List[Point] = lower[:-1] + upper[:-1]
+
+        if len(hull) < 3:
+            raise ValueError('Convex hull must have 3 or more points!')
+
+        return cls._from_sorted_points(hull)
+
+
+    @classmethod
+    def _from_sorted_points(cls, points: List[Point]) -> ConvexPolygon:
+        '''
+        Returns polygon from points that are already sorted counterclockwise and known to form a convex polygon,
+        without sorting them and checking convexity again.
+
+            Parameters:
+                points: List[Point]
+                    counterclockwise sorted list of points of convex polygon.
+
+            Returns:
+                ConvexPolygon:
+                    polygon.
+        '''
+        polygon: ConvexPolygon = cls.__new__(cls)
+        polygon._set_points(points)
+
+        return polygon
+
+
+    @classmethod
+    def from_xy(cls, xs, ys) -> ConvexPolygon:
+        '''
+        Returns polygon from x and y coordinates of its points. Points are sorted and convexity is checked on arrays,
+        so no Point objects are created and checked one by one.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, any sequence, NumPy array or buffer of numbers.
+                ys: array_like
+                    y coordinates of points.
+
+            Returns:
+                ConvexPolygon:
+                    polygon.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+
+        return cls._from_arrays(xs, ys, np.array([0, xs.shape[0]]))[0]
+
+
+    @classmethod
+    def from_ragged(cls, coords, offsets) -> List[ConvexPolygon]:
+        '''
+        Returns many polygons from points stored in one array. Polygon i has points from offsets[i] to offsets[i + 1].
+        Points of all polygons are sorted and checked for convexity together.
+
+            Parameters:
+                coords: array_like
+                    (N, 2) array of points, or flat sequence or buffer of x and y coordinates one after another.
+                offsets: array_like
+                    P + 1 increasing indices of points, starting with 0 and ending with N.
+
+            Returns:
+                List[ConvexPolygon]:
+                    polygons.
+        '''
+        coords = np.asarray(coords, dtype=float)
+
+        if coords.ndim == 1:
+            if coords.shape[0] % 2:
+                raise ValueError('Expected an even number of coordinates')
+
+            coords = coords.reshape(-1, 2)
+
+        xs, ys = as_coordinates(coords)
+        offsets = np.asarray(offsets)
+
+        if offsets.ndim != 1 or offsets.shape[0] < 1 or not np.issubdtype(offsets.dtype, np.integer):
+            raise ValueError('Expected one-dimensional array of integer offsets')
+
+        if offsets[0] != 0 or offsets[-1] != xs.shape[0]:
+            raise ValueError('Offsets must start with 0 and end with number of points')
+
+        return cls._from_arrays(xs, ys, offsets.astype(np.intp))
+
+
+    @classmethod
+    def _from_arrays(cls, xs: np.ndarray, ys: np.ndarray, offsets: np.ndarray) -> List[ConvexPolygon]:
+        '''
+        Returns polygons from coordinates of their points. Points are sorted by the same pseudo-angle as in
+        _sort_points and every turn is checked like in _check_convex, with exact arithmetic only for turns too close
+        to 0 for their float sign to be certain.
+
+            Parameters:
+                xs: np.ndarray
+                    x coordinates of points of all polygons.
+                ys: np.ndarray
+                    y coordinates of points of all polygons.
+                offsets: np.ndarray
+                    indices where points of every polygon start, followed by number of points.
+
+            Returns:
+                List[ConvexPolygon]:
+                    polygons.
+        '''
+        starts: np.ndarray = offsets[:-1]
+        counts: np.ndarray = np.diff(offsets)
+
+        if counts.shape[0] == 0:
+            return []
+
+        if np.any(counts < 3):
+            raise ValueError('Number of points must be 3 or greater!')
+
+        if not (np.all(np.isfinite(xs)) and np.all(np.isfinite(ys))):
+            raise ValueError('Coordinates must be finite!')
+
+        polygon_ids: np.ndarray = np.repeat(np.arange(counts.shape[0]), counts)
+
+        #Pseudo-angle of vector from center of polygon to every point, like in _sort_points
+        dx: np.ndarray = xs - (np.add.reduceat(xs, starts) / counts)[polygon_ids]
+        dy: np.ndarray = ys - (np.add.reduceat(ys, starts) / counts)[polygon_ids]
+        size: np.ndarray = np.abs(dx) + np.abs(dy)
+        ratio: np.ndarray = np.divide(dx, size, out=np.ones_like(dx), where=size != 0)
+        pseudo_angle: np.ndarray = np.where(dy >= 0, 1 - ratio, 3 + ratio)
+
+        #Sorting by polygon and then by pseudo-angle, points of every polygon stay where they were
+        order: np.ndarray = np.lexsort((pseudo_angle, polygon_ids))
+        xs = xs[order]
+        ys = ys[order]
+
+        #Indices of the next and the one after the next point of the same polygon
+        following: np.ndarray = np.arange(1, xs.shape[0] + 1)
+        following[offsets[1:] - 1] = starts
+        after: np.ndarray = following[following]
+
+        #Cross products of every turn with the same error bound as in orientation
+        left: np.ndarray = (xs[following] - xs) * (ys[after] - ys)
+        right: np.ndarray = (ys[following] - ys) * (xs[after] - xs)
+        det: np.ndarray = left - right
+        uncertain: np.ndarray = np.abs(det) <= _ORIENTATION_ERROR * np.abs(left + right)
+
+        if np.any(det[~uncertain] <= 0):
+            raise ValueError('Polygon is not convex!')
+
+        points: List[Point] = [Point._make(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+
+        for i in np.flatnonzero(uncertain).tolist():
+            if orientation(points[i], points[following[i]], points[after[i]]) <= 0:
+                raise ValueError('Polygon is not convex!')
+
+        return [cls._from_sorted_points(points[start:end]) for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
 
 
     def _sort_points(self, points: List[Point]) -> List[Point]:
@@ -252,27 +706,24 @@ class ConvexPolygon:
         mean_x: float = sum_x / len(points)
         mean_y: float = sum_y / len(points)
 
-        #Center of polygon
-        center: Point = Point(mean_x, mean_y)
-        #Point x + 1 away from center
-        center_1: Point = Point(center.x + 1, center.y)
-
-        #Vector form center to center_1
-        center_vector: Vector = Vector(center, center_1)
-
         tmp_points: List[Tuple[float, Point]] = []
 
-        #Calculating angle between center_vector and vector from center to point of polygon
+        #Calculating pseudo-angle of vector from center to point of polygon. It grows with the angle between
+        #x axis and the vector like the real angle does, but it is calculated without trigonometry:
+        #upper half-plane maps to [0, 2) and lower half-plane maps to [2, 4)
         for p in points:
-            vector2: Vector = Vector(center, p)
+            dx: float = p.x - mean_x
+            dy: float = p.y - mean_y
+            size: float = abs(dx) + abs(dy)
+            ratio: float = dx / size if size else 1.0
 
-            angle = Vector.angle_between_vectors(center_vector, vector2)
+            pseudo_angle: float = 1 - ratio if dy >= 0 else 3 + ratio
 
-            #Storing tuple of angle and point
-            tmp_points.append((angle, p))
+            #Storing tuple of pseudo-angle and point
+            tmp_points.append((pseudo_angle, p))
 
-        #Sorting from smallest to largest angle
-        tmp_points.sort()
+        #Sorting from smallest to largest pseudo-angle
+        tmp_points.sort(key=lambda item: item[0])
 
         return [p[1] for p in tmp_points]
 
@@ -297,112 +748,1253 @@ class ConvexPolygon:
                 #If second to last takse first point to form vectors
                 point3: Point = self.points[0 if i == len(self.points) - 2 else i + 2]
 
-            vector1: Vector = Vector(point1, point2)
-            vector2: Vector = Vector(point2, point3)
-
-            #Calculating cross product of vectors
-            is_convex: float = vector1.x * vector2.y - vector1.y * vector2.x
-
-            #Because we are moving counterclockwise every cross product needs to be counterclockwise
-            #If not polygon is not convex raise ValueError
-            if is_convex <= 0:
+            #Because we are moving counterclockwise every turn needs to be counterclockwise
+            #If not polygon is not convex raise ValueError. Sign of the turn is exact, so nearly collinear
+            #points can't be mistaken for a convex turn
+            if orientation(point1, point2, point3) <= 0:
                 raise ValueError('Polygon is not convex!')
 
         #If Exception was not raised return True
         return True
 
 
-    def contains(self, point: Point) -> bool:
+    def _check_index(self, index: int) -> int:
+        '''
+        Returns index of point of polygon as a non-negative number. Negative indices count from the end.
+        '''
+        if not isinstance(index, int):
+            raise TypeError('Expected an argument type: int')
+
+        if not -len(self._points) <= index < len(self._points):
+            raise IndexError('Point index out of range')
+
+        return index % len(self._points)
+
+
+    def _points_changed(self, edge_indices: List[int], rebuild_fan: bool) -> None:
+        '''
+        Updates precomputed data after points of polygon were edited in place. Edges with provided indices are
+        recalculated and inner circle is shrinked so it doesn't cross them.
+        '''
+        for i in edge_indices:
+            self._edges[4 * i:4 * i + 4] = array('d', self._edge_coefficients(i))
+
+        if rebuild_fan:
+            self._build_fan()
+
+        self._shrink_inner_circle(edge_indices)
+        self._version = next(_versions)
+
+
+    def _update_bounds(self, removed: Optional[Point], added: Optional[Point]) -> None:
         '''
-        Returns if polygon contains provieded point or not.
+        Updates bounding box after one point was removed or added. Bounding box is calculated again only if removed point
+        was on it.
+        '''
+        min_x, min_y, max_x, max_y = self._bounds
+
+        if removed is not None and (removed.x in (min_x, max_x) or removed.y in (min_y, max_y)):
+            self._bounds = (
+                min(p.x for p in self._points),
+                min(p.y for p in self._points),
+                max(p.x for p in self._points),
+                max(p.y for p in self._points)
+            )
+        elif added is not None:
+            self._bounds = (min(min_x, added.x), min(min_y, added.y), max(max_x, added.x), max(max_y, added.y))
+
+
+    def insert_vertex(self, point: Point) -> int:
+        '''
+        Adds point to polygon without sorting points again. Edge the point is added to is found with binary search
+        over the fan and convexity is checked only at the new point and its neighbors. Precomputed data is updated
+        only for the two new edges.
 
             Parameters:
                 point: Point
-                    point to check.
+                    point to add, it has to be outside of polygon and polygon has to stay convex.
 
             Returns:
-                bool:
-                    is point in polygon.
+                int:
+                    index of the new point.
         '''
         if not isinstance(point, Point):
             raise TypeError('Expected an argument type: Point')
 
-        for i in range(len(self.points)):
-            #Construct vector from two points
-            if i == len(self.points) - 1:
-                point2: Point = self.points[0]
-            else:
-                point2: Point = self.points[i + 1]
+        n: int = len(self._points)
 
-            point1: Point = self.points[i]
+        #Point goes to the edge it is on the 'right' side of
+        if self._edge_position(0, point) < 0:
+            edge: int = 0
+        elif self._edge_position(n - 1, point) < 0:
+            edge = n - 1
+        else:
+            edge = self._find_wedge(point)
 
-            vector1: Vector = Vector(point1, point2)
-            #Construct vector from point2 to provided point
-            vector2: Vector = Vector(point2, point)
+        previous: Point = self._points[edge]
+        following: Point = self._points[(edge + 1) % n]
 
-            #Coss product to check if point is on the 'left' or 'right' of vector
-            position: float = vector1.x * vector2.y - vector1.y * vector2.x
+        #Only turns at the new point and its neighbors change
+        if orientation(self._points[edge - 1], previous, point) <= 0 or orientation(previous, point, following) <= 0 or \
+                orientation(point, following, self._points[(edge + 2) % n]) <= 0:
+            raise ValueError('Polygon is not convex!')
 
-            #Because we are moving counterclockwise point needs to be on the 'left' side of every vector
-            #If point is not on the 'left' point is not in polygon
-            if position < 0:
-                return False
+        index: int = edge + 1
+        anchor: Point = self._points[0]
 
-        #If point is on the 'left' side of every vector point is in polygon
-        return True
+        self._points.insert(index, point)
+        self._fan.insert(index, (point.x - anchor.x, point.y - anchor.y))
+        self._edges[4 * index:4 * index] = array('d', (0.0, 0.0, 0.0, 0.0))
+        self._update_bounds(None, point)
+        self._points_changed([edge, index], False)
 
+        return index
 
-    def draw(self, point: Point, contains: bool) -> None:
+
+    def move_vertex(self, index: int, point: Point) -> None:
         '''
-        Draws polygon and provided point and writes if polygon contains point or not.
+        Moves point of polygon with provided index to a new position. Convexity is checked only at the moved point and
+        its neighbors and precomputed data is updated only for the two edges of the moved point.
 
             Parameters:
+                index: int
+                    index of point to move.
                 point: Point
-                    point to draw.
-                contains: bool
-                    does polygon contains point.
+                    new position of point, polygon has to stay convex.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        index = self._check_index(index)
+        n: int = len(self._points)
+        previous: Point = self._points[index - 1]
+        following: Point = self._points[(index + 1) % n]
+
+        if orientation(self._points[index - 2], previous, point) <= 0 or orientation(previous, point, following) <= 0 or \
+                orientation(point, following, self._points[(index + 2) % n]) <= 0:
+            raise ValueError('Polygon is not convex!')
+
+        removed: Point = self._points[index]
+        self._points[index] = point
+
+        if index != 0:
+            anchor: Point = self._points[0]
+            self._fan[index] = (point.x - anchor.x, point.y - anchor.y)
+
+        self._update_bounds(removed, point)
+        self._points_changed([(index - 1) % n, index], index == 0)
+
 
+    def remove_vertex(self, index: int) -> Point:
         '''
-        if not isinstance(point, Point) or not isinstance(contains, bool):
-            raise ValueError('Expected arguments type: Point, bool')
+        Removes point of polygon with provided index. Polygon stays convex so convexity is not checked and precomputed
+        data is updated only for the edge between neighbors of the removed point.
 
-        if contains:
-            text: str = f'Polygon contains point {point.x, point.y}'
-        else:
-            text: str = f'Polygon doesn\'t contains point {point.x, point.y}'
+            Parameters:
+                index: int
+                    index of point to remove.
 
-        #List of tuples containing x and y coordinates of point
-        coord: List[Tuple[float, float]] = [(p.x, p.y) for p in self.points]
+            Returns:
+                Point:
+                    removed point.
+        '''
+        index = self._check_index(index)
 
-        #Repeat the first point to create a 'closed loop'
-        coord.append(coord[0])
+        if len(self._points) <= 3:
+            raise ValueError('Number of points must be 3 or greater!')
 
-        #Create lists of x and y values
-        x,y = zip(*coord)
+        removed: Point = self._points.pop(index)
+        del self._edges[4 * index:4 * index + 4]
 
-        plt.figure()
-        plt.rc('grid', linestyle="--")
-        plt.scatter(x, y, color='darkorange', s = 70)
-        plt.plot(x,y)
+        if index != 0:
+            del self._fan[index]
 
-        #If polygon contains point color is green else red
-        plt.scatter(point.x, point.y, color = 'green' if contains else 'red', s = 90)
+        self._update_bounds(removed, None)
+        self._points_changed([(index - 1) % len(self._points)], index == 0)
 
-        max_x: float = self.points[0].x
-        for p in self.points:
-            if p.x > max_x:
-                max_x = p.x
+        return removed
 
-            #If x coordinate is max move it to left
-            if p.x == max_x:
-                #Add coordinate values above point
-                plt.annotate((p.x, p.y), (p.x, p.y), (p.x - 0.4, p.y + 0.1))
-            else:
-                plt.annotate((p.x, p.y), (p.x, p.y), (p.x + 0.1, p.y + 0.1))
 
-        #Add coordinate values above point
-        plt.annotate((point.x, point.y), (point.x, point.y), (point.x + 0.1, point.y + 0.1))
+    def _build_fan(self) -> None:
+        '''
+        Precomputes vectors from the first point of polygon (anchor) to every point of polygon.
+        Those vectors split polygon in triangles (wedges) that contains searches with binary search.
+        '''
+        anchor: Point = self._points[0]
+
+        self._fan: List[Tuple[float, float]] = [(p.x - anchor.x, p.y - anchor.y) for p in self._points]
+
+
+    def _build_edges(self) -> None:
+        '''
+        Precomputes line coefficients of every edge of polygon in a flat array with 4 values per edge: a, b, x, y.
+        Point (px, py) is on the 'left' side of the edge if a * (px - x) + b * (py - y) >= 0, where (a, b) is the edge
+        rotated by 90 degrees and (x, y) is the end of the edge. Keeping the end of the edge instead of the constant
+        c = -(a * x + b * y) gives the same result as the cross product of the edge and vector to the point, so
+        points of polygon are never lost to rounding.
+        '''
+        self._edges: array = array('d')
+
+        for i in range(len(self._points)):
+            self._edges.extend(self._edge_coefficients(i))
+
+
+    def _edge_coefficients(self, i: int) -> Tuple[float, float, float, float]:
+        '''
+        Returns line coefficients a, b, x, y of i-th edge of polygon.
+        '''
+        point1: Point = self._points[i]
+        point2: Point = self._points[(i + 1) % len(self._points)]
+
+        return (point1.y - point2.y, point2.x - point1.x, point2.x, point2.y)
+
+
+    def _build_inner_circle(self) -> None:
+        '''
+        Precomputes circle around the center of polygon that is inside of polygon. Radius is the distance from the
+        center to the closest edge, shrinked a little so rounding can't accept a point on the 'right' side of an edge.
+        '''
+        center_x: float = sum(p.x for p in self._points) / len(self._points)
+        center_y: float = sum(p.y for p in self._points) / len(self._points)
+
+        self._inner_circle: Tuple[float, float, float] = (center_x, center_y, math.inf)
+        self._shrink_inner_circle(range(len(self._points)))
+
+
+    def _shrink_inner_circle(self, edge_indices) -> None:
+        '''
+        Shrinks inner circle so it doesn't cross any of provided edges. Circle keeps its center.
+
+            Parameters:
+                edge_indices: Iterable[int]
+                    indices of edges to check.
+        '''
+        center_x, center_y, radius_sq = self._inner_circle
+
+        #Circle that is too small to be safe stays disabled
+        if radius_sq < 0:
+            return
+
+        edges: array = self._edges
+        radius: float = math.sqrt(radius_sq)
+
+        for k in (4 * i for i in edge_indices):
+            length: float = math.hypot(edges[k], edges[k + 1])
+
+            #Edge between repeated points has no direction, such polygon is rejected by _check_convex
+            if length == 0:
+                self._inner_circle = (center_x, center_y, -1.0)
+                return
+
+            radius = min(radius, (edges[k] * (center_x - edges[k + 2]) + edges[k + 1] * (center_y - edges[k + 3])) / length)
+
+        radius -= 1e-9 * max(abs(center_x), abs(center_y), radius)
+
+        #If circle is too small to be safe no point is accepted by it
+        self._inner_circle = (center_x, center_y, radius * radius if radius > 0 else -1.0)
+
+
+    def _find_wedge(self, point: Point) -> int:
+        '''
+        Returns index of the wedge of the fan that point is in, for point on the 'left' side of the first and the
+        last edge. Wedge i is between fan vectors i and i + 1, its outer edge is edge i.
+
+            Parameters:
+                point: Point
+                    point to locate.
+
+            Returns:
+                int:
+                    index of the wedge.
+        '''
+        anchor: Point = self._points[0]
+        dx: float = point.x - anchor.x
+        dy: float = point.y - anchor.y
+
+        #Binary search for the last fan vector that has point on its 'left' side
+        low: int = 1
+        high: int = len(self._points) - 2
+        while low < high:
+            mid: int = (low + high + 1) // 2
+            fan_x, fan_y = self._fan[mid]
+
+            if fan_x * dy - fan_y * dx >= 0:
+                low = mid
+            else:
+                high = mid - 1
+
+        return low
+
+
+    @staticmethod
+    def _wedge_steps(n: int, wedge: int) -> int:
+        '''
+        Returns number of fan vectors _find_wedge checks before it returns provided wedge of polygon with n points.
+        Every check moves the search towards the returned wedge, so steps follow from the result and points are not
+        checked again.
+        '''
+        steps: int = 0
+
+        low: int = 1
+        high: int = n - 2
+        while low < high:
+            mid: int = (low + high + 1) // 2
+            steps += 1
+
+            if mid <= wedge:
+                low = mid
+            else:
+                high = mid - 1
+
+        return steps
+
+
+    def _in_wedge(self, wedge: int, point: Point) -> bool:
+        '''
+        Returns if point that is on the 'left' side of the first and the last edge is on the 'left' side of the outer
+        edge of provided wedge. Float fan check can put point within rounding distance of a vertex into the wedge
+        next to the one it is in, so outer edges of the neighbouring wedges are checked too.
+
+            Parameters:
+                wedge: int
+                    index of the wedge point was found in.
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point on the 'left' side of the outer edges.
+        '''
+        edges: array = self._edges
+
+        #Wedges are between 1 and n - 2, so their neighbouring edges always exist
+        for k in range(4 * wedge - 4, 4 * wedge + 8, 4):
+            if edges[k] * (point.x - edges[k + 2]) + edges[k + 1] * (point.y - edges[k + 3]) < 0:
+                return False
+
+        return True
+
+
+    def _edge_position(self, i: int, point: Point) -> float:
+        '''
+        Returns cross product of i-th edge of polygon and vector from the end of the edge to provided point,
+        calculated from precomputed edge coefficients. Cross product is >= 0 if point is on the 'left' side of the edge.
+
+            Parameters:
+                i: int
+                    index of the starting point of the edge.
+                point: Point
+                    point to check.
+
+            Returns:
+                float:
+                    cross product.
+        '''
+        edges: array = self._edges
+        k: int = 4 * i
+
+        return edges[k] * (point.x - edges[k + 2]) + edges[k + 1] * (point.y - edges[k + 3])
+
+
+    def contains(self, point: Point) -> bool:
+        '''
+        Returns if polygon contains provieded point or not. Points on the edges of polygon are contained.
+        Points outside of bounding box are rejected and points inside of inner circle are accepted right away.
+        Other points are located in one of the wedges of the fan from the first point with binary search so the
+        check takes O(log n) time.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        x: float = point.x
+        y: float = point.y
+        min_x, min_y, max_x, max_y = self._bounds
+
+        #Point outside of bounding box is not in polygon
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            if self._count_tiers:
+                self._tier_counts[0] += 1
+            return False
+
+        center_x, center_y, radius_sq = self._inner_circle
+
+        #Point inside of inner circle is in polygon
+        if (x - center_x) ** 2 + (y - center_y) ** 2 < radius_sq:
+            if self._count_tiers:
+                self._tier_counts[1] += 1
+            return True
+
+        if self._count_tiers:
+            self._tier_counts[2] += 1
+
+        last: int = len(self.points) - 1
+
+        #Point needs to be on the 'left' side of the first and the last edge, that are the sides of the fan
+        if self._edge_position(0, point) < 0 or self._edge_position(last, point) < 0:
+            return False
+
+        return self._in_wedge(self._find_wedge(point), point)
+
+
+    def locate(self, point: Point) -> int:
+        '''
+        Returns if provided point is inside of polygon, on its edge or outside of it. Unlike contains, every side of
+        edge check uses exact sign of cross product, so points very close to the edges are never misclassified.
+        Check takes O(log n) time and it is only slower than contains for points that are almost on the edges.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                int:
+                    INSIDE, BOUNDARY or OUTSIDE.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        min_x, min_y, max_x, max_y = self._bounds
+
+        if point.x < min_x or point.x > max_x or point.y < min_y or point.y > max_y:
+            return OUTSIDE
+
+        points: List[Point] = self._points
+        last: int = len(points) - 1
+        first_side: int = orientation(points[0], points[1], point)
+        last_side: int = orientation(points[last], points[0], point)
+
+        if first_side < 0 or last_side < 0:
+            return OUTSIDE
+
+        #Binary search for the last fan vector that has point on its 'left' side, like in _find_wedge
+        low: int = 1
+        high: int = last - 1
+        while low < high:
+            mid: int = (low + high + 1) // 2
+
+            if orientation(points[0], points[mid], point) >= 0:
+                low = mid
+            else:
+                high = mid - 1
+
+        outer_side: int = orientation(points[low], points[low + 1], point)
+
+        if outer_side < 0:
+            return OUTSIDE
+
+        #Only the first and the last side of the fan are edges of polygon, other fan vectors are inside of it
+        if outer_side == 0 or (low == 1 and first_side == 0) or (low == last - 1 and last_side == 0):
+            return BOUNDARY
+
+        return INSIDE
+
+
+    def contains_many(self, xs, ys=None) -> np.ndarray:
+        '''
+        Returns boolean mask of which of provided points polygon contains. Points are filtered by bounding box and
+        inner circle first. For the rest, cross products for one edge are calculated for all points at once and
+        points found outside are dropped before the next edge.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+
+            Returns:
+                np.ndarray:
+                    boolean mask, True where polygon contains point.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+
+        mask: np.ndarray = np.zeros(xs.shape[0], dtype=bool)
+        min_x, min_y, max_x, max_y = self._bounds
+        center_x, center_y, radius_sq = self._inner_circle
+
+        #Points outside of bounding box are not in polygon
+        candidates: np.ndarray = np.flatnonzero((xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y))
+        cand_x: np.ndarray = xs[candidates]
+        cand_y: np.ndarray = ys[candidates]
+
+        #Points inside of inner circle are in polygon
+        in_circle: np.ndarray = (cand_x - center_x) ** 2 + (cand_y - center_y) ** 2 < radius_sq
+        mask[candidates[in_circle]] = True
+        candidates = candidates[~in_circle]
+        cand_x = cand_x[~in_circle]
+        cand_y = cand_y[~in_circle]
+
+        if self._count_tiers:
+            self._tier_counts[0] += xs.shape[0] - in_circle.shape[0]
+            self._tier_counts[1] += int(np.count_nonzero(in_circle))
+            self._tier_counts[2] += candidates.shape[0]
+
+        #Candidates are points that are still on the 'left' side of every checked edge
+        for i in range(len(self.points)):
+            if candidates.size == 0:
+                break
+
+            a, b, x, y = self._edges[4 * i:4 * i + 4]
+
+            position: np.ndarray = a * (cand_x - x) + b * (cand_y - y)
+            inside: np.ndarray = position >= 0
+
+            #Drop points that are on the 'right' side of the edge, they are not in polygon
+            if not inside.all():
+                candidates = candidates[inside]
+                cand_x = cand_x[inside]
+                cand_y = cand_y[inside]
+
+        mask[candidates] = True
+
+        return mask
+
+
+    def _overlaps_bounds(self, other: ConvexPolygon) -> bool:
+        '''
+        Returns if bounding boxes of polygons overlap or touch.
+        '''
+        min_x, min_y, max_x, max_y = self._bounds
+        other_min_x, other_min_y, other_max_x, other_max_y = other._bounds
+
+        return min_x <= other_max_x and other_min_x <= max_x and min_y <= other_max_y and other_min_y <= max_y
+
+
+    def _separating_edge(self, other: ConvexPolygon) -> bool:
+        '''
+        Returns if other polygon is whole on the 'right' side of one of the edges of polygon. For every edge, point of
+        other polygon furthest to the 'left' of the edge is found by walking from the point found for the previous
+        edge. Edges turn counterclockwise so the walk goes around other polygon at most once and takes O(n + m) time.
+        '''
+        points: List[Point] = self._points
+        others: List[Point] = other._points
+        edges: array = self._edges
+        n: int = len(points)
+        m: int = len(others)
+
+        def position(k: int, point: Point) -> float:
+            return edges[k] * (point.x - edges[k + 2]) + edges[k + 1] * (point.y - edges[k + 3])
+
+        best: int = max(range(m), key=lambda j: position(0, others[j]))
+
+        for i in range(n):
+            k: int = 4 * i
+            value: float = position(k, others[best])
+
+            while True:
+                following: int = (best + 1) % m
+                following_value: float = position(k, others[following])
+
+                if following_value <= value:
+                    break
+
+                best, value = following, following_value
+
+            #Furthest point and its neighbours are checked exactly, they are the only candidates when values are close
+            start: Point = points[i]
+            end: Point = points[(i + 1) % n]
+            if orientation(start, end, others[best]) < 0 and orientation(start, end, others[best - 1]) < 0 and \
+                    orientation(start, end, others[(best + 1) % m]) < 0:
+                return True
+
+        return False
+
+
+    def intersects(self, other: ConvexPolygon) -> bool:
+        '''
+        Returns if polygons have at least one common point, polygons that only touch intersect too. Polygons don't
+        intersect if and only if an edge of one of them separates them (separating axis theorem), every edge is
+        checked in O(n + m) time in total.
+
+            Parameters:
+                other: ConvexPolygon
+                    polygon to check.
+
+            Returns:
+                bool:
+                    do polygons intersect.
+        '''
+        if not isinstance(other, ConvexPolygon):
+            raise TypeError('Expected an argument type: ConvexPolygon')
+
+        if not self._overlaps_bounds(other):
+            return False
+
+        return not self._separating_edge(other) and not other._separating_edge(self)
+
+
+    @staticmethod
+    def _segment_intersection(start1: Point, end1: Point, start2: Point, end2: Point) -> Tuple[str, Optional[Point]]:
+        '''
+        Returns how segments intersect and their intersection point: '1' if they cross, 'v' if end of one segment
+        is on the other one, 'e' if they are collinear and overlap, and '0' if they don't intersect.
+        '''
+        denominator: float = start1.x * (end2.y - start2.y) + end1.x * (start2.y - end2.y) + \
+            end2.x * (end1.y - start1.y) + start2.x * (start1.y - end1.y)
+
+        if denominator == 0:
+            if orientation(start1, end1, start2) != 0:
+                return '0', None
+
+            #Collinear segments overlap if end of one segment is between ends of the other one
+            def between(point1: Point, point2: Point, point: Point) -> bool:
+                if point1.x != point2.x:
+                    return min(point1.x, point2.x) <= point.x <= max(point1.x, point2.x)
+                return min(point1.y, point2.y) <= point.y <= max(point1.y, point2.y)
+
+            for point1, point2, point in (
+                (start1, end1, start2), (start1, end1, end2), (start2, end2, start1), (start2, end2, end1)
+            ):
+                if between(point1, point2, point):
+                    return 'e', point
+
+            return '0', None
+
+        code: str = '?'
+
+        numerator: float = start1.x * (end2.y - start2.y) + start2.x * (start1.y - end2.y) + end2.x * (start2.y - start1.y)
+        if numerator == 0 or numerator == denominator:
+            code = 'v'
+        s: float = numerator / denominator
+
+        numerator = -(start1.x * (start2.y - end1.y) + end1.x * (start1.y - start2.y) + start2.x * (end1.y - start1.y))
+        if numerator == 0 or numerator == denominator:
+            code = 'v'
+        t: float = numerator / denominator
+
+        if 0 < s < 1 and 0 < t < 1:
+            code = '1'
+        elif s < 0 or s > 1 or t < 0 or t > 1:
+            code = '0'
+
+        return code, Point._make(start1.x + s * (end1.x - start1.x), start1.y + s * (end1.y - start1.y))
+
+
+    @staticmethod
+    def _convex_chain(points: List[Point]) -> List[Point]:
+        '''
+        Returns counterclockwise points without repeated points and points that don't make a strict left turn. Points
+        are walked once from the lowest one, that is always a vertex, so rounded intersection points can't make
+        the result concave.
+        '''
+        start: int = min(range(len(points)), key=lambda i: (points[i].y, points[i].x))
+        chain: List[Point] = []
+
+        for p in points[start:] + points[:start]:
+            if chain and p.x == chain[-1].x and p.y == chain[-1].y:
+                continue
+
+            while len(chain) >= 2 and orientation(chain[-2], chain[-1], p) <= 0:
+                chain.pop()
+
+            chain.append(p)
+
+        while len(chain) >= 3 and orientation(chain[-2], chain[-1], chain[0]) <= 0:
+            chain.pop()
+
+        return chain
+
+
+    def intersection(self, other: ConvexPolygon) -> Optional[ConvexPolygon]:
+        '''
+        Returns polygon that is the common part of two polygons, or None if polygons have no common area. Edges of
+        both polygons are walked together, always advancing the one that is behind (O\'Rourke, Chien, Olson and
+        Naddor), so it takes O(n + m) time. Result is convex and counterclockwise by construction, so its points
+        are not sorted and convexity is not checked again.
+
+            Parameters:
+                other: ConvexPolygon
+                    polygon to intersect with.
+
+            Returns:
+                Optional[ConvexPolygon]:
+                    intersection of polygons.
+        '''
+        if not isinstance(other, ConvexPolygon):
+            raise TypeError('Expected an argument type: ConvexPolygon')
+
+        if not self._overlaps_bounds(other):
+            return None
+
+        points: List[Point] = self._points
+        others: List[Point] = other._points
+        n: int = len(points)
+        m: int = len(others)
+
+        a: int = 0
+        b: int = 0
+        #Number of advances along each polygon
+        a_steps: int = 0
+        b_steps: int = 0
+        #Which polygon is inside of the other one on the current part of the boundary, None until edges cross
+        inside: Optional[str] = None
+        result: List[Point] = []
+
+        while (a_steps < n or b_steps < m) and a_steps < 2 * n and b_steps < 2 * m:
+            a_start: Point = points[a - 1]
+            a_end: Point = points[a]
+            b_start: Point = others[b - 1]
+            b_end: Point = others[b]
+
+            cross: int = _cross_sign(a_start, a_end, b_start, b_end)
+            a_side: int = orientation(b_start, b_end, a_end)
+            b_side: int = orientation(a_start, a_end, b_end)
+
+            code, point = self._segment_intersection(a_start, a_end, b_start, b_end)
+
+            if code == '1' or code == 'v':
+                if inside is None and not result:
+                    a_steps = 0
+                    b_steps = 0
+
+                result.append(point)
+
+                if a_side > 0:
+                    inside = 'a'
+                elif b_side > 0:
+                    inside = 'b'
+
+            #Collinear edges going in opposite directions, polygons only touch
+            if code == 'e' and (a_end.x - a_start.x) * (b_end.x - b_start.x) + (a_end.y - a_start.y) * (b_end.y - b_start.y) < 0:
+                return None
+
+            #Parallel edges with each polygon outside of the other one's edge, polygons are disjoint
+            if cross == 0 and a_side < 0 and b_side < 0:
+                return None
+
+            #Advancing edge of polygon that is behind, end of edge is added if that polygon is inside
+            if cross == 0 and a_side == 0 and b_side == 0:
+                advance_a: bool = inside != 'a'
+            elif cross >= 0:
+                advance_a = b_side > 0
+            else:
+                advance_a = a_side <= 0
+
+            if advance_a:
+                if inside == 'a':
+                    result.append(a_end)
+                a_steps += 1
+                a = (a + 1) % n
+            else:
+                if inside == 'b':
+                    result.append(b_end)
+                b_steps += 1
+                b = (b + 1) % m
+
+        if inside is None:
+            #Boundaries don't cross, one polygon is inside of the other one or they are disjoint
+            if all(self.locate(p) != OUTSIDE for p in others):
+                return other._from_sorted_points(list(others))
+
+            if all(other.locate(p) != OUTSIDE for p in points):
+                return self._from_sorted_points(list(points))
+
+            return None
+
+        chain: List[Point] = self._convex_chain(result)
+
+        return self._from_sorted_points(chain) if len(chain) >= 3 else None
+
+
+    def _nearest_edge(self, point: Point) -> int:
+        '''
+        Returns index of edge that has the point of boundary nearest to provided point outside of polygon, in
+        O(log n) time. Edges that have point on their 'right' side (visible edges) are consecutive and distance
+        along them first falls and then grows, so both the visible edges and the nearest one are found with
+        binary search. Search starts from a known visible and a known not visible edge:
+            point inside of the fan: first edge is not visible and outer edge of point's wedge is visible,
+            point outside of the fan: first or last edge is visible and edge on the opposite side of the first point
+            is not visible.
+
+            Parameters:
+                point: Point
+                    point outside of polygon.
+
+            Returns:
+                int:
+                    index of the nearest edge.
+        '''
+        points: List[Point] = self._points
+        n: int = len(points)
+        anchor: Point = points[0]
+
+        def visible(i: int) -> bool:
+            return orientation(points[i], points[(i + 1) % n], point) < 0
+
+        if not visible(0) and not visible(n - 1):
+            hidden: int = 0
+            seen: int = self._find_wedge(point)
+        else:
+            seen = 0 if visible(0) else n - 1
+            #Ray from the first point away from point leaves polygon through an edge that is not visible
+            opposite: Point = Point._make(2 * anchor.x - point.x, 2 * anchor.y - point.y)
+
+            if orientation(points[0], points[1], opposite) >= 0 and orientation(points[n - 1], points[0], opposite) >= 0:
+                hidden = self._find_wedge(opposite)
+            else:
+                hidden = n - 1 if seen == 0 else 0
+
+        #Wedges are found with float cross products, if point is almost on a fan vector edges are found by walking
+        if not visible(seen):
+            seen = next(i for i in range(n) if visible(i))
+        if visible(hidden):
+            hidden = next(i for i in range(n) if not visible(i))
+
+        #Edges are searched by their offset from the hidden edge, so visible edges are one run of offsets
+        def edge(offset: int) -> int:
+            return (hidden + offset) % n
+
+        #First visible edge
+        low: int = 1
+        high: int = (seen - hidden) % n
+        while low < high:
+            mid: int = (low + high) // 2
+
+            if visible(edge(mid)):
+                high = mid
+            else:
+                low = mid + 1
+        first: int = low
+
+        #Last visible edge
+        low = (seen - hidden) % n
+        high = n - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+
+            if visible(edge(mid)):
+                low = mid
+            else:
+                high = mid - 1
+        last: int = low
+
+        #First visible edge that doesn't have point past its end
+        low = first
+        high = last
+        while low < high:
+            mid = (low + high) // 2
+            start: Point = points[edge(mid)]
+            end: Point = points[edge(mid + 1)]
+
+            if (point.x - end.x) * (end.x - start.x) + (point.y - end.y) * (end.y - start.y) >= 0:
+                low = mid + 1
+            else:
+                high = mid
+
+        return edge(low)
+
+
+    def _nearest_on_edge(self, i: int, point: Point) -> Point:
+        '''
+        Returns point of i-th edge nearest to provided point.
+        '''
+        start: Point = self._points[i]
+        end: Point = self._points[(i + 1) % len(self._points)]
+        dx: float = end.x - start.x
+        dy: float = end.y - start.y
+
+        t: float = ((point.x - start.x) * dx + (point.y - start.y) * dy) / (dx * dx + dy * dy)
+        t = min(max(t, 0.0), 1.0)
+
+        return Point._make(start.x + t * dx, start.y + t * dy)
+
+
+    def _nearest(self, point: Point) -> Tuple[Point, int]:
+        '''
+        Returns point on the edges of polygon nearest to provided point and location of provided point. For points
+        outside of polygon nearest edge is found with binary search in O(log n) time. Nearest edge of point inside of
+        polygon can be any edge, so all edges are checked.
+        '''
+        location: int = self.locate(point)
+
+        if location == OUTSIDE:
+            return self._nearest_on_edge(self._nearest_edge(point), point), location
+
+        edges: array = self._edges
+        nearest: int = 0
+        nearest_distance: float = math.inf
+
+        #Point is on the 'left' side of every edge, distance to edge is distance to its line
+        for i in range(len(self._points)):
+            k: int = 4 * i
+            distance: float = (edges[k] * (point.x - edges[k + 2]) + edges[k + 1] * (point.y - edges[k + 3])) / \
+                math.hypot(edges[k], edges[k + 1])
+
+            if distance < nearest_distance:
+                nearest = i
+                nearest_distance = distance
+
+        return self._nearest_on_edge(nearest, point), location
+
+
+    def nearest_boundary_point(self, point: Point) -> Point:
+        '''
+        Returns point on the edges of polygon nearest to provided point. For points outside of polygon nearest edge
+        is found with binary search in O(log n) time. Nearest edge of point inside of polygon can be any edge,
+        so all edges are checked.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                Point:
+                    nearest point on the edges of polygon.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        return self._nearest(point)[0]
+
+
+    def distance(self, point: Point, signed: bool = False) -> float:
+        '''
+        Returns distance from provided point to the edges of polygon. Inside of polygon is decided with locate.
+
+            Parameters:
+                point: Point
+                    point to check.
+                signed: bool
+                    if True, distance of points inside of polygon is negative.
+
+            Returns:
+                float:
+                    distance to the edges of polygon.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        nearest, location = self._nearest(point)
+        distance: float = math.hypot(point.x - nearest.x, point.y - nearest.y)
+
+        return -distance if signed and location == INSIDE else distance
+
+
+    @staticmethod
+    def _orientation_many(x1, y1, x2, y2, x3, y3) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns float cross products of vectors point1 -> point2 and point1 -> point3 for arrays of points, and mask
+        of cross products that are too close to 0 for their sign to be certain, with the same bound as orientation.
+        '''
+        left: np.ndarray = (x2 - x1) * (y3 - y1)
+        right: np.ndarray = (y2 - y1) * (x3 - x1)
+        det: np.ndarray = left - right
+
+        return det, np.abs(det) <= _ORIENTATION_ERROR * np.abs(left + right)
+
+
+    def _wedge_many(self, vxs: np.ndarray, vys: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns wedges of the fan that points are in, found with binary search for all points at once like in
+        _find_wedge, and mask of points for which a fan vector check was not certain.
+        '''
+        n: int = vxs.shape[0]
+        low: np.ndarray = np.ones(xs.shape[0], dtype=np.intp)
+        high: np.ndarray = np.full(xs.shape[0], n - 2, dtype=np.intp)
+        uncertain: np.ndarray = np.zeros(xs.shape[0], dtype=bool)
+
+        while True:
+            active: np.ndarray = low < high
+            if not active.any():
+                break
+
+            mid: np.ndarray = (low + high + 1) // 2
+            det, unsure = self._orientation_many(vxs[0], vys[0], vxs[mid], vys[mid], xs, ys)
+            left: np.ndarray = det >= 0
+
+            uncertain |= active & unsure
+            low = np.where(active & left, mid, low)
+            high = np.where(active & ~left, mid - 1, high)
+
+        return low, uncertain
+
+
+    def _locate_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        '''
+        Returns location of every point like locate, INSIDE, BOUNDARY or OUTSIDE. Signs are calculated with floats for
+        all points at once, and only points with a sign that is not certain are located again with locate.
+        '''
+        vxs: np.ndarray = np.array([p.x for p in self._points])
+        vys: np.ndarray = np.array([p.y for p in self._points])
+        n: int = vxs.shape[0]
+        min_x, min_y, max_x, max_y = self._bounds
+
+        locations: np.ndarray = np.full(xs.shape[0], OUTSIDE, dtype=np.int8)
+        candidates: np.ndarray = np.flatnonzero((xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y))
+        cand_x: np.ndarray = xs[candidates]
+        cand_y: np.ndarray = ys[candidates]
+
+        first, first_unsure = self._orientation_many(vxs[0], vys[0], vxs[1], vys[1], cand_x, cand_y)
+        last, last_unsure = self._orientation_many(vxs[n - 1], vys[n - 1], vxs[0], vys[0], cand_x, cand_y)
+        wedge, uncertain = self._wedge_many(vxs, vys, cand_x, cand_y)
+        outer, outer_unsure = self._orientation_many(vxs[wedge], vys[wedge], vxs[wedge + 1], vys[wedge + 1], cand_x, cand_y)
+
+        uncertain |= first_unsure | last_unsure | outer_unsure
+        locations[candidates[(first > 0) & (last > 0) & (outer > 0) & ~uncertain]] = INSIDE
+
+        for i in candidates[uncertain].tolist():
+            locations[i] = self.locate(Point._make(float(xs[i]), float(ys[i])))
+
+        return locations
+
+
+    def _nearest_edge_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        '''
+        Returns index of the nearest edge for every point outside of polygon, found with the same binary searches
+        as in _nearest_edge for all points at once, so it takes O(log n) array operations. Points for which a
+        visibility check was not certain are searched again with _nearest_edge.
+        '''
+        vxs: np.ndarray = np.array([p.x for p in self._points])
+        vys: np.ndarray = np.array([p.y for p in self._points])
+        n: int = vxs.shape[0]
+
+        def visible(i: np.ndarray, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            following: np.ndarray = (i + 1) % n
+            det, unsure = self._orientation_many(vxs[i], vys[i], vxs[following], vys[following], x, y)
+            return det < 0, unsure
+
+        zeros: np.ndarray = np.zeros(xs.shape[0], dtype=np.intp)
+        first_visible, uncertain = visible(zeros, xs, ys)
+        last_visible, last_unsure = visible(zeros + n - 1, xs, ys)
+        uncertain |= last_unsure
+        in_fan: np.ndarray = ~first_visible & ~last_visible
+
+        #Point inside of the fan: first edge is hidden and outer edge of its wedge is visible
+        wedge, wedge_unsure = self._wedge_many(vxs, vys, xs, ys)
+
+        #Point outside of the fan: edge where the ray away from point leaves polygon is hidden
+        opposite_x: np.ndarray = 2 * vxs[0] - xs
+        opposite_y: np.ndarray = 2 * vys[0] - ys
+        opposite_first, opposite_first_unsure = self._orientation_many(vxs[0], vys[0], vxs[1], vys[1], opposite_x, opposite_y)
+        opposite_last, opposite_last_unsure = self._orientation_many(vxs[n - 1], vys[n - 1], vxs[0], vys[0], opposite_x, opposite_y)
+        opposite_in_fan: np.ndarray = (opposite_first >= 0) & (opposite_last >= 0)
+        opposite_wedge, opposite_unsure = self._wedge_many(vxs, vys, opposite_x, opposite_y)
+
+        uncertain |= np.where(in_fan, wedge_unsure, opposite_first_unsure | opposite_last_unsure | (opposite_in_fan & opposite_unsure))
+
+        seen: np.ndarray = np.where(in_fan, wedge, np.where(first_visible, 0, n - 1))
+        hidden: np.ndarray = np.where(in_fan, 0, np.where(opposite_in_fan, opposite_wedge, np.where(first_visible, n - 1, 0)))
+
+        #Wedges are found with float cross products, points where they are wrong are searched again one by one
+        seen_visible, seen_unsure = visible(seen, xs, ys)
+        hidden_visible, hidden_unsure = visible(hidden, xs, ys)
+        uncertain |= seen_unsure | hidden_unsure | ~seen_visible | hidden_visible
+
+        offset: np.ndarray = (seen - hidden) % n
+
+        #First visible edge
+        low: np.ndarray = np.ones(xs.shape[0], dtype=np.intp)
+        high: np.ndarray = offset.copy()
+        while True:
+            active: np.ndarray = low < high
+            if not active.any():
+                break
+
+            mid: np.ndarray = (low + high) // 2
+            is_visible, unsure = visible((hidden + mid) % n, xs, ys)
+
+            uncertain |= active & unsure
+            high = np.where(active & is_visible, mid, high)
+            low = np.where(active & ~is_visible, mid + 1, low)
+        first: np.ndarray = low
+
+        #Last visible edge
+        low = offset.copy()
+        high = np.full(xs.shape[0], n - 1, dtype=np.intp)
+        while True:
+            active = low < high
+            if not active.any():
+                break
+
+            mid = (low + high + 1) // 2
+            is_visible, unsure = visible((hidden + mid) % n, xs, ys)
+
+            uncertain |= active & unsure
+            low = np.where(active & is_visible, mid, low)
+            high = np.where(active & ~is_visible, mid - 1, high)
+
+        #First visible edge that doesn't have point past its end
+        low = first
+        while True:
+            active = low < high
+            if not active.any():
+                break
+
+            mid = (low + high) // 2
+            start: np.ndarray = (hidden + mid) % n
+            end: np.ndarray = (start + 1) % n
+            past: np.ndarray = (xs - vxs[end]) * (vxs[end] - vxs[start]) + (ys - vys[end]) * (vys[end] - vys[start]) >= 0
+
+            low = np.where(active & past, mid + 1, low)
+            high = np.where(active & ~past, mid, high)
+
+        nearest: np.ndarray = (hidden + low) % n
+
+        for i in np.flatnonzero(uncertain).tolist():
+            nearest[i] = self._nearest_edge(Point._make(float(xs[i]), float(ys[i])))
+
+        return nearest
+
+
+    def _nearest_many(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        '''
+        Returns x and y coordinates of the nearest points on the edges and locations of points. Nearest edges of
+        points outside of polygon are found with binary search, points inside of polygon are checked against all
+        edges, one edge for all points at once.
+        '''
+        points: List[Point] = self._points
+        locations: np.ndarray = self._locate_many(xs, ys)
+        nearest: np.ndarray = np.zeros(xs.shape[0], dtype=np.intp)
+
+        outside: np.ndarray = np.flatnonzero(locations == OUTSIDE)
+        nearest[outside] = self._nearest_edge_many(xs[outside], ys[outside])
+
+        #Points inside of polygon are on the 'left' side of every edge, distance to edge is distance to its line
+        inside: np.ndarray = np.flatnonzero(locations != OUTSIDE)
+        in_x: np.ndarray = xs[inside]
+        in_y: np.ndarray = ys[inside]
+        nearest_distance: np.ndarray = np.full(inside.shape[0], np.inf)
+
+        for i, (a, b, x, y) in enumerate(np.asarray(self._edges).reshape(-1, 4).tolist()):
+            if inside.size == 0:
+                break
+
+            distance: np.ndarray = (a * (in_x - x) + b * (in_y - y)) / math.hypot(a, b)
+            closer: np.ndarray = distance < nearest_distance
+            nearest_distance[closer] = distance[closer]
+            nearest[inside[closer]] = i
+
+        #Nearest point of every point on its nearest edge
+        start_x: np.ndarray = np.array([p.x for p in points])[nearest]
+        start_y: np.ndarray = np.array([p.y for p in points])[nearest]
+        dx: np.ndarray = np.array([p.x for p in points[1:] + points[:1]])[nearest] - start_x
+        dy: np.ndarray = np.array([p.y for p in points[1:] + points[:1]])[nearest] - start_y
+        t: np.ndarray = np.clip(((xs - start_x) * dx + (ys - start_y) * dy) / (dx * dx + dy * dy), 0.0, 1.0)
+
+        return start_x + t * dx, start_y + t * dy, locations
+
+
+    def nearest_boundary_point_many(self, xs, ys=None) -> np.ndarray:
+        '''
+        Returns points on the edges of polygon nearest to provided points, found like in nearest_boundary_point
+        for all points at once.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+
+            Returns:
+                np.ndarray:
+                    (N, 2) array of nearest points.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+        near_x, near_y, _ = self._nearest_many(xs, ys)
+
+        return np.column_stack((near_x, near_y))
+
+
+    def distance_many(self, xs, ys=None, signed: bool = False) -> np.ndarray:
+        '''
+        Returns distances from provided points to the edges of polygon. Inside of polygon is decided like in locate,
+        so results are the same as the ones of distance.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+                signed: bool
+                    if True, distances of points inside of polygon are negative.
+
+            Returns:
+                np.ndarray:
+                    distances to the edges of polygon.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+        near_x, near_y, locations = self._nearest_many(xs, ys)
+        distances: np.ndarray = np.hypot(xs - near_x, ys - near_y)
+
+        if signed:
+            distances[locations == INSIDE] *= -1
+
+        return distances
+
+
+    def prepare(self) -> PreparedPolygon:
+        '''
+        Returns immutable, query-optimized form of polygon that picks the way of checking points by number of points
+        of polygon and size of batch. Later changes of polygon don't change the prepared polygon.
+
+            Returns:
+                PreparedPolygon:
+                    prepared polygon.
+        '''
+        from prepared import PreparedPolygon
+
+        return PreparedPolygon(self)
+
+
+    def _contains_linear(self, point: Point) -> bool:
+        '''
+        Returns if polygon contains provieded point or not by checking every edge of polygon in O(n) time.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        for i in range(len(self.points)):
+            #Construct vector from two points
+            if i == len(self.points) - 1:
+                point2: Point = self.points[0]
+            else:
+                point2: Point = self.points[i + 1]
+
+            point1: Point = self.points[i]
+
+            vector1: Vector = Vector._make(point1, point2)
+            #Construct vector from point2 to provided point
+            vector2: Vector = Vector._make(point2, point)
+
+            #Coss product to check if point is on the 'left' or 'right' of vector
+            position: float = vector1.x * vector2.y - vector1.y * vector2.x
+
+            #Because we are moving counterclockwise point needs to be on the 'left' side of every vector
+            #If point is not on the 'left' point is not in polygon
+            if position < 0:
+                return False
+
+        #If point is on the 'left' side of every vector point is in polygon
+        return True
+
+
+    def draw(self, point: Point, contains: bool) -> None:
+        '''
+        Draws polygon and provided point and writes if polygon contains point or not.
+
+            Parameters:
+                point: Point
+                    point to draw.
+                contains: bool
+                    does polygon contains point.
+
+        '''
+        if not isinstance(point, Point) or not isinstance(contains, bool):
+            raise ValueError('Expected arguments type: Point, bool')
+
+        #Rendering lives in render module so matplotlib is imported only when polygon is drawn
+        from render import draw_polygon
 
-        plt.figtext(0.5, 0.04, text, horizontalalignment = 'center', fontsize = 15)
-        plt.grid()
-        plt.show()
+        draw_polygon(self, point, contains)
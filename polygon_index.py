@@ -0,0 +1,242 @@
+from __future__ import annotations
+import math
+import numpy as np
+from typing import List, Tuple, Union
+from polygon import Point, ConvexPolygon, as_coordinates
+
+Bounds = Tuple[float, float, float, float]
+
+
+class _Node:
+    '''
+    A class to represent a node of the tree.
+
+        Properties:
+
+            bounds: Bounds
+                bounding box of all children of the node.
+            children: List[Union[_Node, int]]
+                child nodes, or indices of polygons if node is a leaf.
+            leaf: bool
+                is node a leaf.
+    '''
+    __slots__ = ('bounds', 'children', 'leaf')
+
+    def __init__(self, bounds: Bounds, children: List[Union[_Node, int]], leaf: bool) -> None:
+        self.bounds = bounds
+        self.children = children
+        self.leaf = leaf
+
+
+class PolygonIndex:
+    '''
+    A class to represent a spatial index of convex polygons. Bounding boxes of polygons are stored in an R-tree that is
+    bulk loaded with Sort-Tile-Recursive packing, so only polygons whose bounding box contains the point are checked
+    with ConvexPolygon.contains.
+
+    Index is a snapshot: bounding boxes are copied into the tree when it is built. If points of an indexed polygon
+    are replaced or edited with insert_vertex, move_vertex or remove_vertex, queries can return wrong results until
+    rebuild is called. Versions of polygons are stored with the tree, so stale tells if that happened.
+
+        Properties:
+
+            polygons: List[ConvexPolygon]
+                indexed polygons, results of queries are indices into this list.
+            stale: bool
+                was any polygon changed after the tree was built.
+
+        Methods:
+
+            rebuild():
+                builds the tree again from current bounding boxes of polygons.
+
+            query(point: Point):
+                returns indices of polygons that contain point.
+
+            query_many(xs, ys):
+                returns indices of polygons that contain each of the points.
+    '''
+    def __init__(self, polygons: List[ConvexPolygon], node_capacity: int = 16) -> None:
+        '''
+        Constructs the tree over bounding boxes of polygons.
+
+            Parameters:
+
+                polygons: List[ConvexPolygon]
+                    list of polygons to index.
+                node_capacity: int
+                    maximum number of children of a node.
+        '''
+        if not isinstance(polygons, list) or not all(isinstance(p, ConvexPolygon) for p in polygons):
+            raise TypeError('Expected a value type: List[ConvexPolygon]')
+
+        if not isinstance(node_capacity, int) or node_capacity < 2:
+            raise ValueError('Node capacity must be 2 or greater!')
+
+        self._polygons: List[ConvexPolygon] = list(polygons)
+        self._capacity: int = node_capacity
+        self.rebuild()
+
+    #Getters
+    @property
+    def polygons(self) -> List[ConvexPolygon]:
+        return self._polygons
+
+    @property
+    def stale(self) -> bool:
+        return any(p.version != version for p, version in zip(self._polygons, self._versions))
+
+
+    def rebuild(self) -> None:
+        '''
+        Builds the tree from current bounding boxes of polygons.
+        '''
+        self._versions: List[int] = [p.version for p in self._polygons]
+        self._root: Union[_Node, None] = None
+
+        if not self._polygons:
+            return
+
+        #Leaves hold indices of polygons, every next level holds nodes of the level below
+        nodes: List[_Node] = self._pack([(p.bounds, i) for i, p in enumerate(self._polygons)], True)
+        while len(nodes) > 1:
+            nodes = self._pack([(node.bounds, node) for node in nodes], False)
+
+        self._root = nodes[0]
+
+
+    def _pack(self, entries: List[Tuple[Bounds, Union[_Node, int]]], leaf: bool) -> List[_Node]:
+        '''
+        Returns one level of the tree packed with Sort-Tile-Recursive algorithm. Entries are sorted by x coordinate
+        of the center, split in vertical slabs, and every slab is sorted by y coordinate and split in nodes.
+
+            Parameters:
+                entries: List[Tuple[Bounds, Union[_Node, int]]]
+                    bounding boxes and children to pack.
+                leaf: bool
+                    are created nodes leaves.
+
+            Returns:
+                List[_Node]:
+                    nodes of the level.
+        '''
+        num_of_nodes: int = math.ceil(len(entries) / self._capacity)
+        slab_size: int = math.ceil(math.sqrt(num_of_nodes)) * self._capacity
+
+        entries = sorted(entries, key=lambda e: e[0][0] + e[0][2])
+
+        nodes: List[_Node] = []
+        for i in range(0, len(entries), slab_size):
+            slab = sorted(entries[i:i + slab_size], key=lambda e: e[0][1] + e[0][3])
+
+            for j in range(0, len(slab), self._capacity):
+                group = slab[j:j + self._capacity]
+                bounds: Bounds = (
+                    min(e[0][0] for e in group),
+                    min(e[0][1] for e in group),
+                    max(e[0][2] for e in group),
+                    max(e[0][3] for e in group)
+                )
+                nodes.append(_Node(bounds, [e[1] for e in group], leaf))
+
+        return nodes
+
+
+    def query(self, point: Point) -> List[int]:
+        '''
+        Returns indices of polygons that contain provided point.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                List[int]:
+                    sorted indices of polygons that contain point.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        result: List[int] = []
+        stack: List[_Node] = [self._root] if self._root is not None else []
+
+        while stack:
+            node: _Node = stack.pop()
+            min_x, min_y, max_x, max_y = node.bounds
+
+            #Skip the whole subtree if point is outside of its bounding box
+            if point.x < min_x or point.x > max_x or point.y < min_y or point.y > max_y:
+                continue
+
+            if not node.leaf:
+                stack.extend(node.children)
+                continue
+
+            for i in node.children:
+                min_x, min_y, max_x, max_y = self._polygons[i].bounds
+
+                if min_x <= point.x <= max_x and min_y <= point.y <= max_y and self._polygons[i].contains(point):
+                    result.append(i)
+
+        result.sort()
+
+        return result
+
+
+    def query_many(self, xs, ys=None) -> List[List[int]]:
+        '''
+        Returns indices of polygons that contain each of provided points. Points are pushed down the tree together,
+        and every polygon checks only points inside its bounding box with ConvexPolygon.contains_many.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+
+            Returns:
+                List[List[int]]:
+                    sorted indices of polygons that contain point, for every point.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+
+        result: List[List[int]] = [[] for _ in range(xs.shape[0])]
+        stack: List[Tuple[_Node, np.ndarray]] = [(self._root, np.arange(xs.shape[0]))] if self._root is not None else []
+
+        while stack:
+            node, candidates = stack.pop()
+            candidates = self._in_bounds(node.bounds, xs, ys, candidates)
+
+            if candidates.size == 0:
+                continue
+
+            if not node.leaf:
+                stack.extend((child, candidates) for child in node.children)
+                continue
+
+            for i in node.children:
+                polygon: ConvexPolygon = self._polygons[i]
+                inside: np.ndarray = self._in_bounds(polygon.bounds, xs, ys, candidates)
+
+                if inside.size == 0:
+                    continue
+
+                for j in inside[polygon.contains_many(xs[inside], ys[inside])].tolist():
+                    result[j].append(i)
+
+        for r in result:
+            r.sort()
+
+        return result
+
+
+    @staticmethod
+    def _in_bounds(bounds: Bounds, xs: np.ndarray, ys: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        '''
+        Returns indices of candidate points that are inside of the bounding box.
+        '''
+        min_x, min_y, max_x, max_y = bounds
+        cand_x: np.ndarray = xs[candidates]
+        cand_y: np.ndarray = ys[candidates]
+
+        return candidates[(cand_x >= min_x) & (cand_x <= max_x) & (cand_y >= min_y) & (cand_y <= max_y)]
@@ -0,0 +1,59 @@
+import random
+import unittest
+import pytest
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from polygon_index import PolygonIndex
+
+
+def square(x: float, y: float, size: float) -> ConvexPolygon:
+    return ConvexPolygon([Point(x, y), Point(x + size, y), Point(x + size, y + size), Point(x, y + size)])
+
+
+class PolygonIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.polygons = [square(random.uniform(0.0, 100.0), random.uniform(0.0, 100.0), random.uniform(1.0, 10.0)) for _ in range(500)]
+        self.index = PolygonIndex(self.polygons)
+
+    def test_polygon_index_query(self):
+        for _ in range(300):
+            point = Point(random.uniform(0.0, 110.0), random.uniform(0.0, 110.0))
+
+            self.assertEqual(self.index.query(point), [i for i, p in enumerate(self.polygons) if p.contains(point)])
+
+    def test_polygon_index_query_many(self):
+        coords = [(random.uniform(0.0, 110.0), random.uniform(0.0, 110.0)) for _ in range(300)]
+        expected = [[i for i, p in enumerate(self.polygons) if p.contains(Point(x, y))] for x, y in coords]
+
+        self.assertEqual(self.index.query_many(coords), expected)
+
+    def test_polygon_index_query_vertex(self):
+        self.assertIn(7, self.index.query(self.polygons[7].points[2]))
+
+    def test_polygon_index_empty(self):
+        self.assertEqual(PolygonIndex([]).query(Point(1.0, 1.0)), [])
+
+    def test_polygon_index_not_polygons(self):
+        with pytest.raises(TypeError, match='Expected a value type: List\\[ConvexPolygon\\]'):
+            PolygonIndex([1, 2])
+
+    def test_polygon_index_query_not_point(self):
+        with pytest.raises(TypeError, match='Expected an argument type: Point'):
+            self.index.query((1.0, 1.0))
+
+    def test_polygon_index_rebuild(self):
+        point = Point(200.0, 200.0)
+        self.assertFalse(self.index.stale)
+
+        self.polygons[3].points = [Point(195.0, 195.0), Point(205.0, 195.0), Point(205.0, 205.0), Point(195.0, 205.0)]
+
+        self.assertTrue(self.index.stale)
+
+        self.index.rebuild()
+
+        self.assertFalse(self.index.stale)
+        self.assertEqual(self.index.query(point), [3])
@@ -1,16 +1,32 @@
+import sys
 import math
 import random
+import subprocess
 import unittest
 import pytest
+import numpy as np
+from array import array
+from fractions import Fraction
 from polygon import (
     Point,
     Vector,
-    ConvexPolygon
+    ConvexPolygon,
+    orientation,
+    OUTSIDE,
+    INSIDE,
+    BOUNDARY
 )
 
 
 class PolygonTest(unittest.TestCase):
 
+    #Module
+    def test_import_without_plotting(self):
+        code = 'import sys; import polygon; print(*sys.modules)'
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+
+        self.assertFalse([m for m in output.split() if m.split('.')[0] in ('matplotlib', 'render')])
+
     #Point
     def test_point_x(self):
         self.assertEqual(Point(1.20, 0.0).x, 1.20)
@@ -22,6 +38,15 @@ class PolygonTest(unittest.TestCase):
         with pytest.raises(TypeError, match='Expected a value type: float'):
             Point(1,0)
 
+    def test_point_slots(self):
+        with pytest.raises(AttributeError):
+            Point(1.0, 2.0).z = 3.0
+
+    def test_point_make(self):
+        point: Point = Point._make(1.0, 2.0)
+
+        self.assertEqual((point.x, point.y), (1.0, 2.0))
+
     #Vector
     def test_vector_start(self):
         start: Point = Point(1.0, 3.0)
@@ -39,6 +64,13 @@ class PolygonTest(unittest.TestCase):
         with pytest.raises(TypeError, match='Expected a value type: Point'):
             Vector(3, 2)
 
+    def test_vector_make(self):
+        start: Point = Point(1.0, 3.0)
+        end: Point = Point(3.0, 1.0)
+        vector: Vector = Vector._make(start, end)
+
+        self.assertEqual((vector.start, vector.end, vector.x, vector.y), (start, end, 2.0, -2.0))
+
     def test_vector_x(self):
         start: Point = Point(1.0, 3.0)
         end: Point = Point(3.0, 1.0)
@@ -103,6 +135,49 @@ class PolygonTest(unittest.TestCase):
 
         self.assertEqual(ConvexPolygon([points[4], points[2], points[5], points[0], points[6], points[3], points[1]]).points, points)
 
+    def test_convex_polygon_sort_near_collinear(self):
+        points = [Point(1e8, 0.0), Point(1e8 + 1.0, 1e-3), Point(0.0, 1.0), Point(-1e8, 0.0), Point(0.0, -1.0)]
+        polygon = ConvexPolygon([points[3], points[0], points[4], points[2], points[1]])
+
+        self.assertEqual(polygon.points, [points[1], points[2], points[3], points[4], points[0]])
+
+    def test_convex_polygon_from_points_hull(self):
+        random.seed(5)
+        corners = [Point(-5.0, -5.0), Point(5.0, -5.0), Point(5.0, 5.0), Point(-5.0, 5.0)]
+        cloud = [Point(random.uniform(-4.9, 4.9), random.uniform(-4.9, 4.9)) for _ in range(200)]
+        cloud += corners + [Point(0.0, 5.0), Point(5.0, 0.0)]
+        random.shuffle(cloud)
+        polygon = ConvexPolygon.from_points_hull(cloud)
+
+        self.assertEqual(polygon.points, corners)
+        self.assertEqual(polygon._check_convex(), True)
+        self.assertEqual(polygon.contains(Point(0.0, 0.0)), True)
+        self.assertEqual(polygon.contains(Point(6.0, 0.0)), False)
+
+    def test_convex_polygon_from_points_hull_collinear(self):
+        points = [Point(0.0, 0.0), Point(1.0, 1.0), Point(2.0, 2.0)]
+
+        with pytest.raises(ValueError, match='Convex hull must have 3 or more points!'):
+            ConvexPolygon.from_points_hull(points)
+
+    def test_convex_polygon_from_points_hull_nearly_collinear(self):
+        random.seed(5)
+
+        for _ in range(200):
+            #Points sampled along a segment are only collinear up to rounding, plus one point off the segment
+            points = [Point(-5.0, 20.0)]
+            for _ in range(4):
+                t = random.uniform(0.0, 11.0)
+                points.append(Point(t, t * 0.97 + random.uniform(-1e-15, 1e-15)))
+
+            try:
+                hull = ConvexPolygon.from_points_hull(points)
+            except ValueError:
+                continue
+
+            self.assertEqual(hull._check_convex(), True)
+            ConvexPolygon(hull.points)
+
     def test_convex_polygon_points_2points(self):
         points = [Point(6.0, 5.0), Point(-3.0, -4.0)]
 
@@ -177,11 +252,386 @@ class PolygonTest(unittest.TestCase):
 
         self.assertEqual(ConvexPolygon(points).contains(point_to_check), False)
 
+    def test_convex_polygon_contains_edge(self):
+        points = [Point(13.0, 10.0), Point(6.0, 14.0), Point(-6.0, 15.0), Point(-14.0, 7.0), Point(-9.0, -5.0), Point(3.0, -11.0), Point(10.0, -4.0)]
+        point_to_check = Point(-11.5, 1.0)
+
+        self.assertEqual(ConvexPolygon(points).contains(point_to_check), True)
+
+    def test_convex_polygon_contains_every_vertex(self):
+        points = [Point(13.0, 10.0), Point(6.0, 14.0), Point(-6.0, 15.0), Point(-14.0, 7.0), Point(-9.0, -5.0), Point(3.0, -11.0), Point(10.0, -4.0)]
+        polygon = ConvexPolygon(points)
+
+        self.assertTrue(all(polygon.contains(p) for p in points))
+
+    def test_convex_polygon_contains_matches_linear(self):
+        random.seed(25)
+        points = [Point(100.0 * math.cos(2 * math.pi * i / 200), 100.0 * math.sin(2 * math.pi * i / 200)) for i in range(200)]
+        polygon = ConvexPolygon(points)
+        points_to_check = [Point(random.uniform(-110.0, 110.0), random.uniform(-110.0, 110.0)) for _ in range(1000)]
+        points_to_check += points
+
+        for p in points_to_check:
+            self.assertEqual(polygon.contains(p), polygon._contains_linear(p))
+
+    def test_convex_polygon_contains_near_vertex(self):
+        random.seed(1)
+
+        for _ in range(100):
+            polygon = ConvexPolygon.from_points_hull([Point(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(12)])
+            min_x, min_y, max_x, max_y = polygon.bounds
+
+            for vertex in polygon.points:
+                #Points within 1 ulp of vertex, where float fan check can pick the neighbouring wedge
+                for dx in (-math.inf, 0.0, math.inf):
+                    for dy in (-math.inf, 0.0, math.inf):
+                        p = Point(math.nextafter(vertex.x, dx) if dx else vertex.x, math.nextafter(vertex.y, dy) if dy else vertex.y)
+
+                        #Points outside of bounding box are rejected even if rounding puts them on every edge
+                        if p.x < min_x or p.x > max_x or p.y < min_y or p.y > max_y:
+                            self.assertEqual(polygon.contains(p), False)
+                        else:
+                            self.assertEqual(polygon.contains(p), polygon._contains_linear(p))
+
+    def test_convex_polygon_wedge_steps(self):
+        random.seed(18)
+
+        class CountedFan(list):
+            def __getitem__(self, i):
+                self.checks += 1
+                return list.__getitem__(self, i)
+
+        for n in (3, 4, 7, 50):
+            polygon = ConvexPolygon([Point(math.cos(2 * math.pi * i / n), math.sin(2 * math.pi * i / n)) for i in range(n)])
+            polygon._fan = CountedFan(polygon._fan)
+
+            for _ in range(50):
+                p = Point(random.uniform(-1.0, 1.0), random.uniform(-1.0, 1.0))
+                polygon._fan.checks = 0
+                wedge = polygon._find_wedge(p)
+
+                self.assertEqual(ConvexPolygon._wedge_steps(n, wedge), polygon._fan.checks)
+
+    def test_convex_polygon_edges(self):
+        points = [Point(0.0, 0.0), Point(4.0, 0.0), Point(0.0, 3.0)]
+
+        self.assertEqual(ConvexPolygon(points)._edges.tolist(), [3.0, 0.0, 0.0, 0.0, 0.0, 4.0, 4.0, 0.0, -3.0, -4.0, 0.0, 3.0])
+
+    def test_convex_polygon_edges_points_setter(self):
+        polygon = ConvexPolygon([Point(0.0, 0.0), Point(4.0, 0.0), Point(0.0, 3.0)])
+        polygon.points = [Point(10.0, 10.0), Point(14.0, 10.0), Point(10.0, 13.0)]
+
+        self.assertEqual(polygon.contains(Point(1.0, 1.0)), False)
+        self.assertEqual(polygon.contains(Point(11.0, 11.0)), True)
+        self.assertEqual(polygon.contains_many([1.0, 11.0], [1.0, 11.0]).tolist(), [False, True])
+
+    def assert_precomputed(self, polygon):
+        rebuilt = ConvexPolygon.__new__(ConvexPolygon)
+        rebuilt._set_points(list(polygon.points))
+
+        self.assertEqual(polygon._check_convex(), True)
+        self.assertEqual(polygon._edges, rebuilt._edges)
+        self.assertEqual(polygon._fan, rebuilt._fan)
+        self.assertEqual(polygon.bounds, rebuilt.bounds)
+
+        random.seed(15)
+        points_to_check = [Point(random.uniform(-20.0, 20.0), random.uniform(-20.0, 20.0)) for _ in range(500)] + polygon.points
+
+        self.assertEqual([polygon.contains(p) for p in points_to_check], [polygon._contains_linear(p) for p in points_to_check])
+
+    def test_convex_polygon_insert_vertex(self):
+        points = [Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)]
+        polygon = ConvexPolygon(points)
+        version = polygon.version
+        point = Point(5.0, -2.0)
+        index = polygon.insert_vertex(point)
+
+        self.assertEqual(polygon.points[index - 1:index + 2], [points[0], point, points[1]])
+        self.assertNotEqual(polygon.version, version)
+        self.assert_precomputed(polygon)
 
+        polygon.insert_vertex(Point(-3.0, 5.0))
+        polygon.insert_vertex(Point(12.0, 5.0))
 
+        self.assert_precomputed(polygon)
 
+    def test_convex_polygon_insert_vertex_not_convex(self):
+        polygon = ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)])
 
+        for point in (Point(5.0, 5.0), Point(5.0, 0.0), Point(12.0, -2.0), Point(-1.0, -1.0)):
+            with pytest.raises(ValueError, match='Polygon is not convex!'):
+                polygon.insert_vertex(point)
 
+        self.assertEqual(len(polygon.points), 4)
 
+    def test_convex_polygon_move_vertex(self):
+        polygon = ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)])
 
+        for i in range(4):
+            point = polygon.points[i]
+            polygon.move_vertex(i, Point(point.x * 1.5 - 2.0, point.y * 1.5 - 3.0))
 
+            self.assert_precomputed(polygon)
+
+    def test_convex_polygon_move_vertex_not_convex(self):
+        polygon = ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)])
+        points = list(polygon.points)
+
+        with pytest.raises(ValueError, match='Polygon is not convex!'):
+            polygon.move_vertex(0, Point(5.0, 5.0))
+
+        with pytest.raises(IndexError, match='Point index out of range'):
+            polygon.move_vertex(4, Point(5.0, 5.0))
+
+        self.assertEqual(polygon.points, points)
+
+    def test_convex_polygon_remove_vertex(self):
+        points = [Point(13.0, 10.0), Point(6.0, 14.0), Point(-6.0, 15.0), Point(-14.0, 7.0), Point(-9.0, -5.0), Point(3.0, -11.0), Point(10.0, -4.0)]
+        polygon = ConvexPolygon(points)
+
+        self.assertEqual(polygon.remove_vertex(0), points[0])
+        self.assert_precomputed(polygon)
+        self.assertEqual(polygon.remove_vertex(-1), points[6])
+        self.assert_precomputed(polygon)
+        self.assertEqual(polygon.remove_vertex(2), points[3])
+        self.assert_precomputed(polygon)
+        polygon.remove_vertex(1)
+
+        with pytest.raises(ValueError, match='Number of points must be 3 or greater!'):
+            polygon.remove_vertex(1)
+
+    def test_convex_polygon_contains_many(self):
+        points = [Point(13.0, 10.0), Point(6.0, 14.0), Point(-6.0, 15.0), Point(-14.0, 7.0), Point(-9.0, -5.0), Point(3.0, -11.0), Point(10.0, -4.0)]
+        xs = [-4.0, 3.0, 13.0, 13.0, 13.0, -16.0, -11.5]
+        ys = [5.0, 6.0, 10.0, -9.0, 6.0, -4.0, 1.0]
+
+        self.assertEqual(ConvexPolygon(points).contains_many(xs, ys).tolist(), [True, True, True, False, False, False, True])
+
+    def test_convex_polygon_contains_many_array(self):
+        random.seed(2)
+        points = [Point(13.0, 10.0), Point(6.0, 14.0), Point(-6.0, 15.0), Point(-14.0, 7.0), Point(-9.0, -5.0), Point(3.0, -11.0), Point(10.0, -4.0)]
+        polygon = ConvexPolygon(points)
+        coords = np.array([(random.uniform(-20.0, 20.0), random.uniform(-20.0, 20.0)) for _ in range(1000)])
+
+        self.assertEqual(polygon.contains_many(coords).tolist(), [polygon.contains(Point(x, y)) for x, y in coords.tolist()])
+
+    def test_convex_polygon_tier_counts(self):
+        points = [Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)]
+        polygon = ConvexPolygon(points)
+        points_to_check = [Point(20.0, 5.0), Point(5.0, 5.0), Point(0.5, 0.5), Point(10.0, 10.0)]
+
+        self.assertEqual([polygon.contains(p) for p in points_to_check], [False, True, True, True])
+        self.assertEqual(polygon.tier_counts, {'bounding_box': 0, 'inner_circle': 0, 'edges': 0})
+
+        polygon.count_tiers = True
+
+        self.assertEqual([polygon.contains(p) for p in points_to_check], [False, True, True, True])
+        self.assertEqual(polygon.tier_counts, {'bounding_box': 1, 'inner_circle': 1, 'edges': 2})
+        self.assertEqual(polygon.tier_stats(), {'bounding_box': 0.25, 'inner_circle': 0.25, 'edges': 0.5})
+
+        polygon.contains_many([20.0, 5.0, 0.5, 10.0], [5.0, 5.0, 0.5, 10.0])
+
+        self.assertEqual(polygon.tier_counts, {'bounding_box': 2, 'inner_circle': 2, 'edges': 4})
+
+        with pytest.raises(TypeError, match='Expected a value type: bool'):
+            polygon.count_tiers = 1
+
+    def test_convex_polygon_inner_circle_far_from_origin(self):
+        points = [Point(1e8, 1e8), Point(1e8 + 1e-3, 1e8), Point(1e8, 1e8 + 1e-3)]
+        polygon = ConvexPolygon(points)
+
+        self.assertEqual(polygon.contains(Point(1e8 + 1e-3, 1e8 + 1e-3)), False)
+        self.assertTrue(all(polygon.contains(p) for p in points))
+
+    def test_convex_polygon_contains_many_bad_shape(self):
+        points = [Point(6.0, 5.0), Point(-3.0, -4.0), Point(10.0, -4.0)]
+
+        with pytest.raises(ValueError, match='Expected an array of shape \\(N, 2\\)'):
+            ConvexPolygon(points).contains_many([1.0, 2.0, 3.0])
+
+    def test_orientation_nearly_collinear(self):
+        end1 = Point(12.0, 12.0)
+        end2 = Point(24.0, 24.0)
+
+        for i in range(32):
+            for j in range(32):
+                point = Point(0.5 + i * 2.0 ** -53, 0.5 + j * 2.0 ** -53)
+                exact = (Fraction(end1.x) - Fraction(point.x)) * (Fraction(end2.y) - Fraction(point.y)) - \
+                    (Fraction(end1.y) - Fraction(point.y)) * (Fraction(end2.x) - Fraction(point.x))
+
+                self.assertEqual(orientation(point, end1, end2), (exact > 0) - (exact < 0))
+
+    def test_convex_polygon_locate(self):
+        polygon = ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(5.0, 15.0), Point(0.0, 10.0)])
+        points_to_check = [
+            Point(5.0, 5.0), Point(5.0, 0.0), Point(0.0, 0.0), Point(0.0, 5.0), Point(7.5, 12.5), Point(10.0, 10.0),
+            Point(5.0, -1e-300), Point(7.5, 12.5 + 1e-15), Point(20.0, 5.0), Point(5.0, 5.0 + 10.0)
+        ]
+
+        self.assertEqual(
+            [polygon.locate(p) for p in points_to_check],
+            [INSIDE, BOUNDARY, BOUNDARY, BOUNDARY, BOUNDARY, BOUNDARY, OUTSIDE, OUTSIDE, OUTSIDE, BOUNDARY]
+        )
+
+    def test_convex_polygon_repeated_point(self):
+        points = [Point(0.0, 0.0), Point(1.0, 0.0), Point(1.0, 0.0), Point(0.0, 1.0)]
+
+        with pytest.raises(ValueError, match='Polygon is not convex!'):
+            ConvexPolygon(points)
+
+    def test_convex_polygon_nearly_collinear_not_convex(self):
+        points = [Point(0.0, 0.0), Point(0.5, 0.5 + 2.0 ** -53), Point(1.0, 1.0), Point(0.0, 1.0)]
+
+        with pytest.raises(ValueError, match='Polygon is not convex!'):
+            ConvexPolygon(points)
+
+    def test_convex_polygon_from_xy(self):
+        points = [Point(10.0, -4.0), Point(6.0, 5.0), Point(-3.0, -4.0), Point(-3.0, 5.0)]
+        polygon = ConvexPolygon.from_xy(array('d', [p.x for p in points]), np.array([p.y for p in points]))
+
+        self.assertEqual(
+            [(p.x, p.y) for p in polygon.points],
+            [(p.x, p.y) for p in ConvexPolygon(points).points]
+        )
+        self.assert_precomputed(polygon)
+
+    def test_convex_polygon_from_ragged(self):
+        coords = [6.0, 5.0, -3.0, -4.0, 10.0, -4.0, 0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 1.0]
+        polygons = ConvexPolygon.from_ragged(array('d', coords), [0, 3, 7])
+
+        self.assertEqual(len(polygons), 2)
+        self.assertEqual([(p.x, p.y) for p in polygons[0].points], [(6.0, 5.0), (-3.0, -4.0), (10.0, -4.0)])
+        self.assertEqual([(p.x, p.y) for p in polygons[1].points], [(1.0, 1.0), (0.0, 1.0), (0.0, 0.0), (1.0, 0.0)])
+        self.assertEqual(ConvexPolygon.from_ragged(np.zeros((0, 2)), [0]), [])
+
+    def test_convex_polygon_from_ragged_invalid(self):
+        coords = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [0.0, 1.0], [1.0, 0.0], [0.5, 0.5]])
+
+        with pytest.raises(ValueError, match='Polygon is not convex!'):
+            ConvexPolygon.from_ragged(coords, [0, 3, 6])
+
+        with pytest.raises(ValueError, match='Number of points must be 3 or greater!'):
+            ConvexPolygon.from_ragged(coords, [0, 2, 6])
+
+        with pytest.raises(ValueError, match='Offsets must start with 0 and end with number of points'):
+            ConvexPolygon.from_ragged(coords, [0, 3, 5])
+
+        with pytest.raises(ValueError, match='Coordinates must be finite!'):
+            ConvexPolygon.from_xy([0.0, 1.0, float('nan')], [0.0, 0.0, 1.0])
+
+    def test_convex_polygon_intersects(self):
+        square = ConvexPolygon([Point(0.0, 0.0), Point(2.0, 0.0), Point(2.0, 2.0), Point(0.0, 2.0)])
+        polygons = [
+            ConvexPolygon([Point(1.0, 1.0), Point(3.0, 1.0), Point(3.0, 3.0)]),
+            ConvexPolygon([Point(2.0, 2.0), Point(3.0, 2.0), Point(3.0, 3.0)]),
+            ConvexPolygon([Point(0.5, 0.5), Point(1.5, 0.5), Point(1.0, 1.5)]),
+            ConvexPolygon([Point(2.5, 0.0), Point(3.0, 0.0), Point(3.0, 3.0)]),
+            ConvexPolygon([Point(1.5, 3.0), Point(3.0, 1.5), Point(3.0, 3.0)])
+        ]
+
+        self.assertEqual([square.intersects(p) for p in polygons], [True, True, True, False, False])
+        self.assertEqual([p.intersects(square) for p in polygons], [True, True, True, False, False])
+
+        with pytest.raises(TypeError, match='Expected an argument type: ConvexPolygon'):
+            square.intersects(Point(1.0, 1.0))
+
+    def test_convex_polygon_intersection(self):
+        square = ConvexPolygon([Point(0.0, 0.0), Point(2.0, 0.0), Point(2.0, 2.0), Point(0.0, 2.0)])
+        diamond = ConvexPolygon([Point(1.0, -1.0), Point(3.0, 1.0), Point(1.0, 3.0), Point(-1.0, 1.0)])
+        inner = ConvexPolygon([Point(0.5, 0.5), Point(1.5, 0.5), Point(1.0, 1.5)])
+
+        intersection = square.intersection(diamond)
+
+        self.assertEqual(
+            sorted((p.x, p.y) for p in intersection.points),
+            [(0.0, 0.0), (0.0, 2.0), (2.0, 0.0), (2.0, 2.0)]
+        )
+        self.assert_precomputed(intersection)
+        self.assertEqual([(p.x, p.y) for p in square.intersection(inner).points], [(p.x, p.y) for p in inner.points])
+        self.assertIsNone(square.intersection(ConvexPolygon([Point(2.0, 0.0), Point(3.0, 0.0), Point(3.0, 2.0)])))
+
+    def test_convex_polygon_intersection_random(self):
+        random.seed(21)
+        def area(polygon):
+            points = polygon.points
+            return sum(p.x * q.y - q.x * p.y for p, q in zip(points, points[1:] + points[:1])) / 2
+
+        for _ in range(100):
+            polygon1 = ConvexPolygon.from_points_hull([Point(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(10)])
+            polygon2 = ConvexPolygon.from_points_hull([Point(random.uniform(3, 13), random.uniform(3, 13)) for _ in range(10)])
+            intersection = polygon1.intersection(polygon2)
+
+            if intersection is None:
+                self.assertTrue(all(polygon2.locate(p) != INSIDE for p in polygon1.points))
+                continue
+
+            vertices = {(p.x, p.y) for p in intersection.points}
+
+            self.assertTrue(polygon1.intersects(polygon2))
+            self.assertAlmostEqual(area(intersection), area(polygon2.intersection(polygon1)))
+            self.assertTrue(all((p.x, p.y) in vertices for p in polygon1.points if polygon2.locate(p) == INSIDE))
+            self.assertTrue(all((p.x, p.y) in vertices for p in polygon2.points if polygon1.locate(p) == INSIDE))
+            ConvexPolygon(intersection.points)
+
+    def test_convex_polygon_nearest_boundary_point(self):
+        polygon = ConvexPolygon([Point(0.0, 0.0), Point(4.0, 0.0), Point(4.0, 2.0), Point(0.0, 2.0)])
+        points_to_check = [Point(2.0, 5.0), Point(6.0, 3.0), Point(-1.0, 1.0), Point(3.0, 0.5), Point(4.0, 1.0)]
+        nearest = [polygon.nearest_boundary_point(p) for p in points_to_check]
+
+        self.assertEqual([(p.x, p.y) for p in nearest], [(2.0, 2.0), (4.0, 2.0), (0.0, 1.0), (3.0, 0.0), (4.0, 1.0)])
+        self.assertEqual([polygon.distance(p) for p in points_to_check], [3.0, math.sqrt(5.0), 1.0, 0.5, 0.0])
+        self.assertEqual(polygon.distance(Point(3.0, 0.5), signed=True), -0.5)
+
+        with pytest.raises(TypeError, match='Expected an argument type: Point'):
+            polygon.distance((1.0, 1.0))
+
+    def test_convex_polygon_distance_many_matches_distance(self):
+        random.seed(23)
+        polygon = ConvexPolygon.from_points_hull([Point(random.uniform(0, 10), random.uniform(0, 0.1)) for _ in range(40)])
+        points = []
+
+        #Points on edges, at vertices and very close to them, where float checks can't tell the side
+        for start, end in zip(polygon.points, polygon.points[1:] + polygon.points[:1]):
+            t = random.random()
+            points.append(Point(start.x + t * (end.x - start.x), start.y + t * (end.y - start.y)))
+            points.append(Point(start.x, start.y))
+            points.append(Point(start.x + random.uniform(-1e-12, 1e-12), start.y + random.uniform(-1e-12, 1e-12)))
+
+        points += [Point(random.uniform(-5, 15), random.uniform(-5, 5)) for _ in range(200)]
+
+        distances = polygon.distance_many([p.x for p in points], [p.y for p in points], signed=True)
+        nearest = polygon.nearest_boundary_point_many([p.x for p in points], [p.y for p in points])
+
+        for p, batch_distance, batch_nearest in zip(points, distances, nearest):
+            self.assertAlmostEqual(batch_distance, polygon.distance(p, signed=True))
+            self.assertEqual(math.copysign(1.0, batch_distance) < 0, polygon.locate(p) == INSIDE)
+            self.assertAlmostEqual(batch_nearest[0], polygon.nearest_boundary_point(p).x)
+            self.assertAlmostEqual(batch_nearest[1], polygon.nearest_boundary_point(p).y)
+
+
+    def test_convex_polygon_distance_random(self):
+        random.seed(22)
+        polygon = ConvexPolygon.from_points_hull([Point(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(50)])
+        points = [Point(random.uniform(-10, 20), random.uniform(-10, 20)) for _ in range(500)]
+
+        def segment_distance(point, start, end):
+            dx = end.x - start.x
+            dy = end.y - start.y
+            t = min(max(((point.x - start.x) * dx + (point.y - start.y) * dy) / (dx * dx + dy * dy), 0.0), 1.0)
+            return math.hypot(point.x - start.x - t * dx, point.y - start.y - t * dy)
+
+        expected = [
+            min(segment_distance(p, q, r) for q, r in zip(polygon.points, polygon.points[1:] + polygon.points[:1]))
+            for p in points
+        ]
+        distances = polygon.distance_many([p.x for p in points], [p.y for p in points], signed=True)
+
+        for p, distance, batch_distance in zip(points, expected, distances):
+            self.assertAlmostEqual(polygon.distance(p), distance)
+            self.assertAlmostEqual(batch_distance, -distance if polygon.locate(p) == INSIDE else distance)
+            self.assertEqual(batch_distance < 0, polygon.distance(p, signed=True) < 0)
+
+        nearest = polygon.nearest_boundary_point_many(np.array([[p.x, p.y] for p in points]))
+
+        self.assertEqual(nearest.shape, (500, 2))
+        self.assertTrue(np.allclose(np.hypot(nearest[:, 0] - [p.x for p in points], nearest[:, 1] - [p.y for p in points]), expected))
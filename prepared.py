@@ -0,0 +1,390 @@
+from __future__ import annotations
+import numpy as np
+from array import array
+from concurrent.futures import Executor, Future
+from typing import Callable, List, Tuple
+from polygon import Point, ConvexPolygon, as_coordinates
+
+#Polygons with at most this many points check single points by walking all edges instead of binary search
+LINEAR_MAX_VERTICES: int = 8
+#Batches with fewer points are checked point by point instead of with array operations
+BATCH_MIN_POINTS: int = 16
+#Polygons with at most this many points check batches edge by edge instead of with binary search over wedges
+BATCH_EDGES_MAX_VERTICES: int = 32
+#Default number of points in one chunk of contains_many_threaded
+THREAD_CHUNK_SIZE: int = 65536
+
+
+class PreparedPolygon:
+    '''
+    A class to represent an immutable, query-optimized form of convex polygon. It keeps coordinates and precomputed
+    edges and fan in compact arrays and picks the way of checking points by number of points of polygon and size
+    of batch. ConvexPolygon stays the validating builder, PreparedPolygon is created with ConvexPolygon.prepare.
+
+    Thread safety: all data is set when polygon is prepared and never changes after, attributes can't be set and
+    edges, fan and coordinates are kept in read-only buffers and arrays. Queries only read that data and write to arrays they create themselves, so one
+    PreparedPolygon can be shared by any number of threads without locks. Batches are checked with NumPy operations
+    that release the GIL, so contains_many_threaded can use more than one core inside one process.
+    ConvexPolygon is not safe to share like that, its points can be replaced and its queries update tier counters
+    while count_tiers is enabled.
+
+        Properties:
+
+            xs: np.ndarray
+                read-only x coordinates of points of polygon, counterclockwise.
+            ys: np.ndarray
+                read-only y coordinates of points of polygon, counterclockwise.
+            bounds: Tuple[float, float, float, float]
+                bounding box of polygon (min x, min y, max x, max y).
+            strategy: str
+                how single points are checked, 'linear' or 'wedge'.
+
+        Methods:
+
+            contains(point: Point):
+                returns if polygon contains point or not.
+
+            contains_xy(x: float, y: float):
+                returns if polygon contains point with provided coordinates or not.
+
+            contains_many(xs, ys):
+                returns boolean mask of which points polygon contains.
+
+            contains_many_threaded(xs, ys, executor: Executor, chunk_size: int):
+                returns boolean mask of which points polygon contains, checking chunks of points in threads.
+
+            batch_strategy(num_of_points: int):
+                returns how a batch of points is checked, 'scalar', 'edges' or 'wedge'.
+    '''
+    __slots__ = ('_n', '_anchor', '_bounds', '_inner_circle', '_edges', '_fan', '_np_edges', '_np_fan', '_xs', '_ys', '_contains_xy')
+
+    def __init__(self, polygon: ConvexPolygon) -> None:
+        '''
+        Copies points and precomputed data of polygon into compact arrays and picks the way of checking points.
+
+            Parameters:
+                polygon: ConvexPolygon
+                    polygon to prepare.
+        '''
+        if not isinstance(polygon, ConvexPolygon):
+            raise TypeError('Expected an argument type: ConvexPolygon')
+
+        n: int = len(polygon.points)
+        #Edges and fan are read-only views of bytes, so neither queries nor other code can change them
+        edges: memoryview = memoryview(array('d', polygon._edges).tobytes()).cast('d')
+        fan: memoryview = memoryview(array('d', [c for vector in polygon._fan for c in vector]).tobytes()).cast('d')
+
+        #Arrays share memory with edges and fan, rows of edges are (a, b, x, y) and rows of fan are (x, y)
+        np_edges: np.ndarray = np.frombuffer(edges, dtype=float).reshape(n, 4)
+        np_fan: np.ndarray = np.frombuffer(fan, dtype=float).reshape(n, 2)
+        xs: np.ndarray = np.array([p.x for p in polygon.points])
+        ys: np.ndarray = np.array([p.y for p in polygon.points])
+
+        for a in (np_edges, np_fan, xs, ys):
+            a.flags.writeable = False
+
+        set_attr: Callable = object.__setattr__
+        set_attr(self, '_n', n)
+        set_attr(self, '_anchor', (polygon.points[0].x, polygon.points[0].y))
+        set_attr(self, '_bounds', polygon.bounds)
+        set_attr(self, '_inner_circle', polygon._inner_circle)
+        set_attr(self, '_edges', edges)
+        set_attr(self, '_fan', fan)
+        set_attr(self, '_np_edges', np_edges)
+        set_attr(self, '_np_fan', np_fan)
+        set_attr(self, '_xs', xs)
+        set_attr(self, '_ys', ys)
+        set_attr(self, '_contains_xy', self._contains_linear if n <= LINEAR_MAX_VERTICES else self._contains_wedge)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError('PreparedPolygon is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('PreparedPolygon is immutable')
+
+    def __len__(self) -> int:
+        return self._n
+
+    #Getters
+    @property
+    def xs(self) -> np.ndarray:
+        return self._xs
+
+    @property
+    def ys(self) -> np.ndarray:
+        return self._ys
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        return self._bounds
+
+    @property
+    def strategy(self) -> str:
+        return 'linear' if self._n <= LINEAR_MAX_VERTICES else 'wedge'
+
+
+    def batch_strategy(self, num_of_points: int) -> str:
+        '''
+        Returns how a batch of points is checked: 'scalar' checks points one by one, 'edges' checks all points against
+        one edge at a time and 'wedge' does binary search over wedges of the fan for all points at once.
+
+            Parameters:
+                num_of_points: int
+                    number of points in batch.
+
+            Returns:
+                str:
+                    name of the strategy.
+        '''
+        if num_of_points < BATCH_MIN_POINTS:
+            return 'scalar'
+
+        return 'edges' if self._n <= BATCH_EDGES_MAX_VERTICES else 'wedge'
+
+
+    def contains(self, point: Point) -> bool:
+        '''
+        Returns if polygon contains provided point or not. Points on the edges of polygon are contained.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        return self._contains_xy(point.x, point.y)
+
+
+    def contains_xy(self, x: float, y: float) -> bool:
+        '''
+        Returns if polygon contains point with provided coordinates or not, without creating a Point.
+
+            Parameters:
+                x: float
+                    point x coordinate.
+                y: float
+                    point y coordinate.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        return self._contains_xy(x, y)
+
+
+    def _quick_check(self, x: float, y: float):
+        '''
+        Returns False if point is outside of bounding box, True if it is inside of inner circle and None otherwise.
+        '''
+        min_x, min_y, max_x, max_y = self._bounds
+
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            return False
+
+        center_x, center_y, radius_sq = self._inner_circle
+
+        if (x - center_x) ** 2 + (y - center_y) ** 2 < radius_sq:
+            return True
+
+        return None
+
+
+    def _contains_linear(self, x: float, y: float) -> bool:
+        '''
+        Checks point against every edge, used for polygons with few points.
+        '''
+        quick = self._quick_check(x, y)
+        if quick is not None:
+            return quick
+
+        edges: memoryview = self._edges
+        for k in range(0, len(edges), 4):
+            if edges[k] * (x - edges[k + 2]) + edges[k + 1] * (y - edges[k + 3]) < 0:
+                return False
+
+        return True
+
+
+    def _contains_wedge(self, x: float, y: float) -> bool:
+        '''
+        Checks point with binary search over wedges of the fan from the first point, the same as ConvexPolygon.contains.
+        '''
+        quick = self._quick_check(x, y)
+        if quick is not None:
+            return quick
+
+        edges: memoryview = self._edges
+        k: int = 4 * (self._n - 1)
+
+        #Point needs to be on the 'left' side of the first and the last edge, that are the sides of the fan
+        if edges[0] * (x - edges[2]) + edges[1] * (y - edges[3]) < 0 or edges[k] * (x - edges[k + 2]) + edges[k + 1] * (y - edges[k + 3]) < 0:
+            return False
+
+        fan: memoryview = self._fan
+        dx: float = x - self._anchor[0]
+        dy: float = y - self._anchor[1]
+
+        #Binary search for the last fan vector that has point on its 'left' side
+        low: int = 1
+        high: int = self._n - 2
+        while low < high:
+            mid: int = (low + high + 1) // 2
+
+            if fan[2 * mid] * dy - fan[2 * mid + 1] * dx >= 0:
+                low = mid
+            else:
+                high = mid - 1
+
+        #Point is in the wedge between fan vectors low and low + 1, or in a neighbouring one if it is within rounding
+        #distance of a vertex, so it has to be on the 'left' of the outer edges of all three, like in ConvexPolygon._in_wedge
+        for k in range(4 * low - 4, 4 * low + 8, 4):
+            if edges[k] * (x - edges[k + 2]) + edges[k + 1] * (y - edges[k + 3]) < 0:
+                return False
+
+        return True
+
+
+    def contains_many(self, xs, ys=None) -> np.ndarray:
+        '''
+        Returns boolean mask of which of provided points polygon contains. Small batches are checked point by point,
+        larger ones with array operations edge by edge for polygons with few points or with binary search over wedges
+        of the fan for polygons with many points.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+
+            Returns:
+                np.ndarray:
+                    boolean mask, True where polygon contains point.
+        '''
+        xs, ys = as_coordinates(xs, ys)
+        strategy: str = self.batch_strategy(xs.shape[0])
+
+        if strategy == 'scalar':
+            return np.array([self._contains_xy(x, y) for x, y in zip(xs.tolist(), ys.tolist())], dtype=bool)
+
+        mask: np.ndarray = np.zeros(xs.shape[0], dtype=bool)
+        min_x, min_y, max_x, max_y = self._bounds
+        center_x, center_y, radius_sq = self._inner_circle
+
+        #Points outside of bounding box are not in polygon, points inside of inner circle are
+        candidates: np.ndarray = np.flatnonzero((xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y))
+        cand_x: np.ndarray = xs[candidates]
+        cand_y: np.ndarray = ys[candidates]
+
+        in_circle: np.ndarray = (cand_x - center_x) ** 2 + (cand_y - center_y) ** 2 < radius_sq
+        mask[candidates[in_circle]] = True
+        candidates = candidates[~in_circle]
+
+        if strategy == 'edges':
+            mask[candidates] = self._edges_many(cand_x[~in_circle], cand_y[~in_circle])
+        else:
+            mask[candidates] = self._wedge_many(cand_x[~in_circle], cand_y[~in_circle])
+
+        return mask
+
+
+    def contains_many_threaded(self, xs, ys=None, executor: Executor = None, chunk_size: int = THREAD_CHUNK_SIZE) -> np.ndarray:
+        '''
+        Returns boolean mask of which of provided points polygon contains. Points are split into chunks that are
+        checked with contains_many in threads of executor, and results are written to one mask.
+
+            Parameters:
+                xs: array_like
+                    x coordinates of points, or an (N, 2) array of points if ys is not provided.
+                ys: array_like
+                    y coordinates of points.
+                executor: Executor
+                    executor with threads chunks are checked in, usually a ThreadPoolExecutor.
+                chunk_size: int
+                    number of points in one chunk.
+
+            Returns:
+                np.ndarray:
+                    boolean mask, True where polygon contains point.
+        '''
+        if not isinstance(executor, Executor):
+            raise TypeError('Expected an argument type: Executor')
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('Chunk size must be 1 or greater!')
+
+        xs, ys = as_coordinates(xs, ys)
+        mask: np.ndarray = np.zeros(xs.shape[0], dtype=bool)
+
+        def check(start: int) -> None:
+            end: int = start + chunk_size
+            mask[start:end] = self.contains_many(xs[start:end], ys[start:end])
+
+        #Chunks write to different parts of the mask, so they don't need a lock
+        futures: List[Future] = [executor.submit(check, start) for start in range(0, xs.shape[0], chunk_size)]
+        for future in futures:
+            future.result()
+
+        return mask
+
+
+    def _edges_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        '''
+        Checks all points against one edge at a time and drops points found outside before the next edge.
+        '''
+        inside: np.ndarray = np.ones(xs.shape[0], dtype=bool)
+        candidates: np.ndarray = np.arange(xs.shape[0])
+
+        for a, b, x, y in self._np_edges.tolist():
+            if candidates.size == 0:
+                break
+
+            left: np.ndarray = a * (xs - x) + b * (ys - y) >= 0
+
+            if not left.all():
+                inside[candidates[~left]] = False
+                candidates = candidates[left]
+                xs = xs[left]
+                ys = ys[left]
+
+        return inside
+
+
+    def _wedge_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        '''
+        Does binary search over wedges of the fan for all points at once, taking O(log n) array operations.
+        '''
+        edges: np.ndarray = self._np_edges
+
+        #Point needs to be on the 'left' side of the first and the last edge, that are the sides of the fan
+        inside: np.ndarray = (edges[0, 0] * (xs - edges[0, 2]) + edges[0, 1] * (ys - edges[0, 3]) >= 0) & \
+            (edges[-1, 0] * (xs - edges[-1, 2]) + edges[-1, 1] * (ys - edges[-1, 3]) >= 0)
+
+        dx: np.ndarray = xs - self._anchor[0]
+        dy: np.ndarray = ys - self._anchor[1]
+        low: np.ndarray = np.ones(xs.shape[0], dtype=np.intp)
+        high: np.ndarray = np.full(xs.shape[0], self._n - 2, dtype=np.intp)
+
+        #Binary search for the last fan vector that has point on its 'left' side
+        while True:
+            active: np.ndarray = low < high
+            if not active.any():
+                break
+
+            mid: np.ndarray = (low + high + 1) // 2
+            left: np.ndarray = self._np_fan[mid, 0] * dy - self._np_fan[mid, 1] * dx >= 0
+
+            low = np.where(active & left, mid, low)
+            high = np.where(active & ~left, mid - 1, high)
+
+        #Point is in the wedge between fan vectors low and low + 1, or in a neighbouring one if it is within rounding
+        #distance of a vertex, so it has to be on the 'left' of the outer edges of all three
+        for offset in (-1, 0, 1):
+            edge: np.ndarray = edges[low + offset]
+            inside &= edge[:, 0] * (xs - edge[:, 2]) + edge[:, 1] * (ys - edge[:, 3]) >= 0
+
+        return inside
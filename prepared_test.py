@@ -0,0 +1,129 @@
+import math
+import random
+import unittest
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from prepared import PreparedPolygon
+
+
+def regular_polygon(num_of_vertices: int) -> ConvexPolygon:
+    return ConvexPolygon([Point(100.0 * math.cos(2 * math.pi * i / num_of_vertices), 100.0 * math.sin(2 * math.pi * i / num_of_vertices)) for i in range(num_of_vertices)])
+
+
+class PreparedPolygonTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(12)
+        self.coords = np.array([(random.uniform(-110.0, 110.0), random.uniform(-110.0, 110.0)) for _ in range(2000)])
+
+    def test_prepared_polygon_strategy(self):
+        self.assertEqual(regular_polygon(5).prepare().strategy, 'linear')
+        self.assertEqual(regular_polygon(500).prepare().strategy, 'wedge')
+
+    def test_prepared_polygon_batch_strategy(self):
+        self.assertEqual(regular_polygon(5).prepare().batch_strategy(1), 'scalar')
+        self.assertEqual(regular_polygon(5).prepare().batch_strategy(1000), 'edges')
+        self.assertEqual(regular_polygon(500).prepare().batch_strategy(1000), 'wedge')
+
+    def test_prepared_polygon_contains(self):
+        for n in (3, 5, 50, 500):
+            polygon = regular_polygon(n)
+            prepared = polygon.prepare()
+            points = [Point(x, y) for x, y in self.coords.tolist()] + polygon.points
+
+            self.assertEqual([prepared.contains(p) for p in points], [polygon.contains(p) for p in points])
+
+    def test_prepared_polygon_contains_many(self):
+        for n in (3, 5, 50, 500):
+            polygon = regular_polygon(n)
+            prepared = polygon.prepare()
+            coords = np.vstack([self.coords, [(p.x, p.y) for p in polygon.points]])
+            expected = [polygon.contains(Point(x, y)) for x, y in coords.tolist()]
+
+            self.assertEqual(prepared.contains_many(coords).tolist(), expected)
+            self.assertEqual(prepared.contains_many(coords[:5]).tolist(), expected[:5])
+
+    def test_prepared_polygon_contains_near_vertex(self):
+        for _ in range(20):
+            angles = [random.uniform(0, 2 * math.pi) for _ in range(60)]
+            polygon = ConvexPolygon.from_points_hull([Point(5.0 + 5.0 * math.cos(a), 5.0 + 5.0 * math.sin(a)) for a in angles])
+            prepared = polygon.prepare()
+            min_x, min_y, max_x, max_y = polygon.bounds
+
+            #Points within 1 ulp of vertices, where float fan check can pick the neighbouring wedge
+            points = [
+                Point(math.nextafter(v.x, dx), math.nextafter(v.y, dy))
+                for v in polygon.points for dx in (-math.inf, math.inf) for dy in (-math.inf, math.inf)
+            ]
+            expected = [min_x <= p.x <= max_x and min_y <= p.y <= max_y and polygon._contains_linear(p) for p in points]
+
+            self.assertEqual(prepared.strategy, 'wedge')
+            self.assertEqual(prepared.batch_strategy(len(points)), 'wedge')
+            self.assertEqual([prepared.contains(p) for p in points], expected)
+            self.assertEqual(prepared.contains_many([p.x for p in points], [p.y for p in points]).tolist(), expected)
+
+    def test_prepared_polygon_immutable(self):
+        prepared = regular_polygon(5).prepare()
+
+        with pytest.raises(AttributeError, match='PreparedPolygon is immutable'):
+            prepared._n = 3
+
+        with pytest.raises(ValueError):
+            prepared.xs[0] = 1.0
+
+        with pytest.raises(TypeError):
+            prepared._edges[0] = 1.0
+
+        with pytest.raises(TypeError):
+            prepared._fan[0] = 1.0
+
+        with pytest.raises(ValueError):
+            prepared._np_edges[0, 0] = 1.0
+
+    def test_prepared_polygon_not_polygon(self):
+        with pytest.raises(TypeError, match='Expected an argument type: ConvexPolygon'):
+            PreparedPolygon([Point(1.0, 1.0)])
+
+    def test_prepared_polygon_contains_many_threaded(self):
+        prepared = regular_polygon(50).prepare()
+
+        with ThreadPoolExecutor(4) as executor:
+            mask = prepared.contains_many_threaded(self.coords, executor=executor, chunk_size=300)
+
+        self.assertEqual(mask.tolist(), prepared.contains_many(self.coords).tolist())
+
+        with pytest.raises(TypeError, match='Expected an argument type: Executor'):
+            prepared.contains_many_threaded(self.coords)
+
+        with ThreadPoolExecutor(1) as executor, pytest.raises(ValueError, match='Chunk size must be 1 or greater!'):
+            prepared.contains_many_threaded(self.coords, executor=executor, chunk_size=0)
+
+    def test_prepared_polygon_concurrent(self):
+        prepareds = [regular_polygon(n).prepare() for n in (5, 50, 500)]
+        expected = [p.contains_many(self.coords).tolist() for p in prepareds]
+        points = [Point(x, y) for x, y in self.coords.tolist()]
+
+        def query(task):
+            prepared = prepareds[task % 3]
+            start = (task * 97) % 1500
+
+            return (
+                task % 3,
+                start,
+                prepared.contains_many(self.coords[start:start + 500]).tolist(),
+                [prepared.contains(p) for p in points[start:start + 50]],
+                [prepared.contains_xy(x, y) for x, y in self.coords[start:start + 5].tolist()]
+            )
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(query, range(300)))
+
+        for i, start, batch, single, xy in results:
+            self.assertEqual(batch, expected[i][start:start + 500])
+            self.assertEqual(single, expected[i][start:start + 50])
+            self.assertEqual(xy, expected[i][start:start + 5])
@@ -0,0 +1,232 @@
+from __future__ import annotations
+import time
+from typing import Callable, Dict, Optional
+from polygon import Point, Vector, ConvexPolygon
+
+#Methods that are instrumented, as (class, attribute, name in snapshot)
+_TARGETS = (
+    (ConvexPolygon, '_sort_points', 'ConvexPolygon._sort_points'),
+    (ConvexPolygon, '_check_convex', 'ConvexPolygon._check_convex'),
+    (ConvexPolygon, 'contains', 'ConvexPolygon.contains'),
+    (Vector, '__init__', 'Vector.__init__'),
+    (Vector, '_make', 'Vector._make')
+)
+
+#Places where contains can return
+EXITS = ('bounding_box', 'inner_circle', 'first_edge', 'last_edge', 'wedge_edge')
+
+
+class Profiler:
+    '''
+    A class to represent opt-in instrumentation of hot paths of ConvexPolygon and Vector. While profiler is enabled
+    instrumented methods are replaced with wrappers that count calls and measure time, and contains also records how
+    many edges were examined and where it returned. When profiler is disabled original methods are put back, so there
+    is no cost at all. Only one profiler can be enabled at a time and counters are not synchronized between threads.
+
+        Properties:
+
+            enabled: bool
+                is profiler enabled.
+
+        Methods:
+
+            enable():
+                starts recording.
+
+            disable():
+                stops recording, recorded statistics are kept.
+
+            snapshot():
+                returns recorded statistics.
+
+            reset():
+                clears recorded statistics.
+    '''
+    _active: Optional[Profiler] = None
+
+    def __init__(self) -> None:
+        '''
+        Constructs a disabled profiler with empty statistics.
+        '''
+        self._originals: Dict[str, object] = {}
+
+        #Number of calls and total time in nanoseconds of every method, wrappers keep references to these dicts
+        self._calls: Dict[str, int] = {}
+        self._times: Dict[str, int] = {}
+        self.reset()
+
+    #Getters
+    @property
+    def enabled(self) -> bool:
+        return Profiler._active is self
+
+    def __enter__(self) -> Profiler:
+        self.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disable()
+
+
+    def reset(self) -> None:
+        '''
+        Clears recorded statistics.
+        '''
+        for _, _, name in _TARGETS:
+            self._calls[name] = 0
+            self._times[name] = 0
+
+        self._edges: int = 0
+        self._exits: Dict[str, int] = {place: 0 for place in EXITS}
+        #Number of contains calls for every number of examined edges
+        self._edges_histogram: Dict[int, int] = {}
+
+
+    def enable(self) -> None:
+        '''
+        Starts recording by replacing instrumented methods with wrappers.
+        '''
+        if Profiler._active is self:
+            return
+
+        if Profiler._active is not None:
+            raise RuntimeError('Another profiler is already enabled')
+
+        for cls, attribute, name in _TARGETS:
+            original = cls.__dict__[attribute]
+            self._originals[name] = original
+
+            if isinstance(original, classmethod):
+                setattr(cls, attribute, classmethod(self._timed(name, original.__func__)))
+            elif attribute == 'contains':
+                setattr(cls, attribute, self._timed_contains(original))
+            else:
+                setattr(cls, attribute, self._timed(name, original))
+
+        Profiler._active = self
+
+
+    def disable(self) -> None:
+        '''
+        Stops recording and puts original methods back. Recorded statistics are kept.
+        '''
+        if Profiler._active is not self:
+            return
+
+        for cls, attribute, name in _TARGETS:
+            setattr(cls, attribute, self._originals.pop(name))
+
+        Profiler._active = None
+
+
+    def _timed(self, name: str, function: Callable) -> Callable:
+        '''
+        Returns wrapper of function that counts its calls and measures its time.
+        '''
+        calls: Dict[str, int] = self._calls
+        times: Dict[str, int] = self._times
+        clock: Callable[[], int] = time.perf_counter_ns
+
+        def wrapper(*args, **kwargs):
+            start: int = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                times[name] += clock() - start
+                calls[name] += 1
+
+        wrapper.__wrapped__ = function
+        wrapper.__doc__ = function.__doc__
+
+        return wrapper
+
+
+    def _timed_contains(self, function: Callable) -> Callable:
+        '''
+        Returns wrapper of ConvexPolygon.contains that also records examined edges and where contains returned.
+        Place and edges are found after the call so their counting is not included in measured time.
+        '''
+        timed: Callable = self._timed('ConvexPolygon.contains', function)
+
+        def wrapper(polygon: ConvexPolygon, point: Point) -> bool:
+            result: bool = timed(polygon, point)
+            self._record(*_exit(polygon, point))
+
+            return result
+
+        wrapper.__wrapped__ = function
+        wrapper.__doc__ = function.__doc__
+
+        return wrapper
+
+
+    def _record(self, place: str, edges: int) -> None:
+        self._exits[place] += 1
+        self._edges += edges
+        self._edges_histogram[edges] = self._edges_histogram.get(edges, 0) + 1
+
+
+    def snapshot(self) -> Dict[str, Dict]:
+        '''
+        Returns recorded statistics. Every instrumented method has number of calls and total and mean time in
+        seconds, contains also has total and mean number of examined edges, number of calls for every place it can
+        return from and number of calls for every number of examined edges.
+
+            Returns:
+                Dict[str, Dict]:
+                    statistics for every instrumented method.
+        '''
+        stats: Dict[str, Dict] = {}
+
+        for _, _, name in _TARGETS:
+            calls: int = self._calls[name]
+            stats[name] = {
+                'calls': calls,
+                'total_time': self._times[name] / 1e9,
+                'mean_time': self._times[name] / 1e9 / calls if calls else 0.0
+            }
+
+        contains: Dict = stats['ConvexPolygon.contains']
+        resolved: int = sum(self._exits.values())
+        contains['edges_examined'] = self._edges
+        contains['mean_edges'] = self._edges / resolved if resolved else 0.0
+        contains['exits'] = dict(self._exits)
+        contains['edges_histogram'] = dict(sorted(self._edges_histogram.items()))
+
+        return stats
+
+
+def _exit(polygon: ConvexPolygon, point: Point) -> tuple:
+    '''
+    Returns where contains returned and how many edges and fan vectors it examined. Mirrors the tiers of
+    ConvexPolygon.contains, the wedge is found with _find_wedge and fan vectors it checked with _wedge_steps.
+    '''
+    min_x, min_y, max_x, max_y = polygon.bounds
+
+    if point.x < min_x or point.x > max_x or point.y < min_y or point.y > max_y:
+        return 'bounding_box', 0
+
+    center_x, center_y, radius_sq = polygon._inner_circle
+
+    if (point.x - center_x) ** 2 + (point.y - center_y) ** 2 < radius_sq:
+        return 'inner_circle', 0
+
+    last: int = len(polygon._points) - 1
+
+    if polygon._edge_position(0, point) < 0:
+        return 'first_edge', 1
+
+    if polygon._edge_position(last, point) < 0:
+        return 'last_edge', 2
+
+    wedge: int = polygon._find_wedge(point)
+    examined: int = 2 + ConvexPolygon._wedge_steps(last + 1, wedge)
+
+    #Outer edges of the wedge and its neighbours are checked until point is on the 'right' side of one
+    for i in range(wedge - 1, wedge + 2):
+        examined += 1
+
+        if polygon._edge_position(i, point) < 0:
+            break
+
+    return 'wedge_edge', examined
@@ -0,0 +1,64 @@
+import unittest
+import pytest
+from polygon import (
+    Point,
+    Vector,
+    ConvexPolygon
+)
+from profiling import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.points = [Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)]
+
+    def test_profiler_counts(self):
+        with Profiler() as profiler:
+            polygon = ConvexPolygon(self.points)
+            polygon.contains(Point(20.0, 20.0))
+            polygon.contains(Point(5.0, 5.0))
+            polygon.contains(Point(9.9, 9.9))
+            Vector(Point(0.0, 0.0), Point(1.0, 1.0))
+
+        stats = profiler.snapshot()
+        contains = stats['ConvexPolygon.contains']
+
+        self.assertEqual(stats['ConvexPolygon._sort_points']['calls'], 1)
+        self.assertEqual(stats['ConvexPolygon._check_convex']['calls'], 1)
+        self.assertEqual(stats['Vector.__init__']['calls'], 1)
+        self.assertEqual(contains['calls'], 3)
+        self.assertEqual(contains['exits']['bounding_box'], 1)
+        self.assertEqual(contains['exits']['inner_circle'], 1)
+        self.assertEqual(contains['exits']['wedge_edge'], 1)
+        self.assertEqual(contains['edges_histogram'][0], 2)
+        self.assertEqual(contains['edges_histogram'][6], 1)
+        self.assertGreater(contains['total_time'], 0.0)
+
+    def test_profiler_disabled(self):
+        original = ConvexPolygon.contains
+        profiler = Profiler()
+
+        with profiler:
+            self.assertTrue(profiler.enabled)
+            self.assertIsNot(ConvexPolygon.contains, original)
+
+        self.assertFalse(profiler.enabled)
+        self.assertIs(ConvexPolygon.contains, original)
+
+        ConvexPolygon(self.points).contains(Point(5.0, 5.0))
+        self.assertEqual(profiler.snapshot()['ConvexPolygon.contains']['calls'], 0)
+
+    def test_profiler_reset(self):
+        with Profiler() as profiler:
+            polygon = ConvexPolygon(self.points)
+            profiler.reset()
+            polygon.contains(Point(5.0, 5.0))
+
+        self.assertEqual(profiler.snapshot()['ConvexPolygon._sort_points']['calls'], 0)
+        self.assertEqual(profiler.snapshot()['ConvexPolygon.contains']['calls'], 1)
+
+    def test_profiler_one_enabled(self):
+        with Profiler():
+            with pytest.raises(RuntimeError, match='Another profiler is already enabled'):
+                Profiler().enable()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from typing import List, Tuple
+from polygon import Point, ConvexPolygon, as_coordinates
+
+#Batches with more points are decimated to this many points before drawing
+MAX_POINTS: int = 100000
+#Vertices are annotated with their coordinates only if there are at most this many of them
+MAX_ANNOTATED_VERTICES: int = 50
+
+
+def draw_polygon(polygon: ConvexPolygon, point: Point, contains: bool) -> None:
+    '''
+    Draws polygon and provided point and writes if polygon contains point or not.
+
+        Parameters:
+            polygon: ConvexPolygon
+                polygon to draw.
+            point: Point
+                point to draw.
+            contains: bool
+                does polygon contains point.
+    '''
+    if not isinstance(polygon, ConvexPolygon) or not isinstance(point, Point) or not isinstance(contains, bool):
+        raise ValueError('Expected arguments type: ConvexPolygon, Point, bool')
+
+    if contains:
+        text: str = f'Polygon contains point {point.x, point.y}'
+    else:
+        text: str = f'Polygon doesn\'t contains point {point.x, point.y}'
+
+    #List of tuples containing x and y coordinates of point
+    coord: List[Tuple[float, float]] = [(p.x, p.y) for p in polygon.points]
+
+    #Repeat the first point to create a 'closed loop'
+    coord.append(coord[0])
+
+    #Create lists of x and y values
+    x,y = zip(*coord)
+
+    plt.figure()
+    plt.rc('grid', linestyle="--")
+    plt.scatter(x, y, color='darkorange', s = 70)
+    plt.plot(x,y)
+
+    #If polygon contains point color is green else red
+    plt.scatter(point.x, point.y, color = 'green' if contains else 'red', s = 90)
+
+    max_x: float = polygon.points[0].x
+    for p in polygon.points:
+        if p.x > max_x:
+            max_x = p.x
+
+        #If x coordinate is max move it to left
+        if p.x == max_x:
+            #Add coordinate values above point
+            plt.annotate((p.x, p.y), (p.x, p.y), (p.x - 0.4, p.y + 0.1))
+        else:
+            plt.annotate((p.x, p.y), (p.x, p.y), (p.x + 0.1, p.y + 0.1))
+
+    #Add coordinate values above point
+    plt.annotate((point.x, point.y), (point.x, point.y), (point.x + 0.1, point.y + 0.1))
+
+    plt.figtext(0.5, 0.04, text, horizontalalignment = 'center', fontsize = 15)
+    plt.grid()
+    plt.show()
+
+
+def render_batch(path: str, polygons: List[ConvexPolygon], xs=None, ys=None, inside=None, max_points: int = MAX_POINTS,
+        max_annotated: int = MAX_ANNOTATED_VERTICES, size: Tuple[float, float] = (10.0, 10.0), dpi: int = 100) -> Figure:
+    '''
+    Draws polygons and points to a file, without opening a window. All polygons are drawn with one PolyCollection
+    and all points with one scatter, figure is drawn with Agg so it works without a display. Format of the file is
+    picked by its extension, like .png or .svg.
+
+        Parameters:
+            path: str
+                path to the file.
+            polygons: List[ConvexPolygon]
+                polygons to draw.
+            xs: array_like
+                x coordinates of points, or an (N, 2) array of points if ys is not provided. No points are drawn if None.
+            ys: array_like
+                y coordinates of points.
+            inside: array_like
+                boolean mask of points that are in a polygon, drawn green while other points are drawn red.
+                Points are drawn in one color if None.
+            max_points: int
+                maximum number of drawn points, every k-th point is drawn if there are more.
+            max_annotated: int
+                vertices are annotated with their coordinates only if polygons have at most this many vertices.
+            size: Tuple[float, float]
+                size of figure in inches.
+            dpi: int
+                resolution of raster formats in dots per inch.
+
+        Returns:
+            Figure:
+                drawn figure.
+    '''
+    if not isinstance(polygons, list) or not all(isinstance(p, ConvexPolygon) for p in polygons):
+        raise TypeError('Expected a value type: List[ConvexPolygon]')
+
+    if not isinstance(max_points, int) or max_points < 1:
+        raise ValueError('Maximum number of points must be 1 or greater!')
+
+    if inside is not None and xs is None:
+        raise ValueError('Expected points for the inside mask')
+
+    figure: Figure = Figure(figsize=size, dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.grid(linestyle='--')
+
+    axes.add_collection(PolyCollection(
+        [[(p.x, p.y) for p in polygon.points] for polygon in polygons],
+        facecolors='tab:blue', edgecolors='darkorange', alpha=0.4
+    ))
+
+    if xs is not None:
+        xs, ys = as_coordinates(xs, ys)
+        colors = 'tab:blue'
+
+        if inside is not None:
+            inside = np.asarray(inside, dtype=bool)
+
+            if inside.shape != xs.shape:
+                raise ValueError('Expected one-dimensional arrays of equal length')
+
+        #Dense sets of points are decimated evenly, so every part of the set stays visible
+        if xs.shape[0] > max_points:
+            drawn: np.ndarray = np.linspace(0, xs.shape[0] - 1, max_points).astype(np.intp)
+            xs = xs[drawn]
+            ys = ys[drawn]
+            inside = inside[drawn] if inside is not None else None
+
+        if inside is not None:
+            colors = np.where(inside, 'green', 'red')
+
+        axes.scatter(xs, ys, c=colors, s=4, linewidths=0)
+
+    vertices: List[Point] = [p for polygon in polygons for p in polygon.points]
+
+    if len(vertices) <= max_annotated:
+        for p in vertices:
+            axes.annotate((p.x, p.y), (p.x, p.y), fontsize=8)
+
+    axes.autoscale_view()
+    figure.savefig(path)
+
+    return figure
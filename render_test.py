@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+import pytest
+import numpy as np
+from matplotlib.collections import PolyCollection, PathCollection
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from render import render_batch
+
+
+class RenderBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.polygons = [
+            ConvexPolygon([Point(0.0, 0.0), Point(4.0, 0.0), Point(4.0, 4.0), Point(0.0, 4.0)]),
+            ConvexPolygon([Point(5.0, 5.0), Point(8.0, 5.0), Point(6.0, 8.0)])
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_render_batch_png(self):
+        path = os.path.join(self.directory.name, 'report.png')
+        coords = np.random.default_rng(25).uniform(-1.0, 9.0, (5000, 2))
+        inside = self.polygons[0].contains_many(coords) | self.polygons[1].contains_many(coords)
+
+        figure = render_batch(path, self.polygons, coords, inside=inside, max_points=1000)
+        axes = figure.axes[0]
+        polygons = [c for c in axes.collections if isinstance(c, PolyCollection)]
+        points = [c for c in axes.collections if isinstance(c, PathCollection)]
+
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+
+        self.assertEqual(len(polygons[0].get_paths()), 2)
+        self.assertEqual(len(points[0].get_offsets()), 1000)
+        self.assertEqual(len(axes.texts), 7)
+
+    def test_render_batch_svg_without_annotations(self):
+        path = os.path.join(self.directory.name, 'report.svg')
+
+        figure = render_batch(path, self.polygons * 10, max_annotated=50)
+
+        with open(path) as f:
+            self.assertIn('<svg', f.read())
+
+        self.assertEqual(len(figure.axes[0].texts), 0)
+
+    def test_render_batch_invalid(self):
+        path = os.path.join(self.directory.name, 'report.png')
+
+        with pytest.raises(TypeError, match='Expected a value type: List\\[ConvexPolygon\\]'):
+            render_batch(path, [Point(1.0, 1.0)])
+
+        with pytest.raises(ValueError, match='Expected one-dimensional arrays of equal length'):
+            render_batch(path, self.polygons, [1.0, 2.0], [1.0, 2.0], inside=[True])
+
+        with pytest.raises(ValueError, match='Expected points for the inside mask'):
+            render_batch(path, self.polygons, inside=[True])
@@ -0,0 +1,159 @@
+from __future__ import annotations
+import mmap
+import numpy as np
+from typing import Iterator, List, Optional
+from polygon import Point, ConvexPolygon
+
+#File starts with MAGIC and number of polygons, followed by offset table and coordinates, all little-endian
+MAGIC: bytes = b'CVXPOLY1'
+_HEADER_SIZE: int = 16
+
+
+def save_polygons(path: str, polygons: List[ConvexPolygon]) -> None:
+    '''
+    Saves polygons to a binary file. Points are saved already sorted counterclockwise, so polygons don't need to be
+    sorted and checked again when they are loaded.
+
+    Layout of the file:
+        MAGIC (8 bytes), number of polygons N (uint64),
+        offsets (N + 1 uint64), polygon i has points from offsets[i] to offsets[i + 1],
+        coordinates (float64 x, y pairs of all points).
+
+        Parameters:
+            path: str
+                path to the file.
+            polygons: List[ConvexPolygon]
+                polygons to save.
+    '''
+    if not isinstance(polygons, list) or not all(isinstance(p, ConvexPolygon) for p in polygons):
+        raise TypeError('Expected a value type: List[ConvexPolygon]')
+
+    offsets: np.ndarray = np.zeros(len(polygons) + 1, dtype='<u8')
+    offsets[1:] = np.cumsum([len(p.points) for p in polygons])
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.array([len(polygons)], dtype='<u8').tobytes())
+        f.write(offsets.tobytes())
+
+        for polygon in polygons:
+            f.write(np.array([(p.x, p.y) for p in polygon.points], dtype='<f8').tobytes())
+
+
+class PolygonFile:
+    '''
+    A class to represent polygons saved with save_polygons. File is memory-mapped and polygons are created only
+    when they are accessed, from points that are read straight from the mapped file without sorting them and checking
+    convexity. Opening a file takes the same time regardless of its size.
+
+        Methods:
+
+            coords(index: int):
+                returns (N, 2) read-only array of points of polygon that shares memory with the file.
+
+            close():
+                unmaps the file.
+    '''
+    def __init__(self, path: str) -> None:
+        '''
+        Memory-maps the file and reads its header.
+
+            Parameters:
+                path: str
+                    path to the file.
+        '''
+        with open(path, 'rb') as f:
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < _HEADER_SIZE or self._mmap[:len(MAGIC)] != MAGIC:
+                raise ValueError('Not a polygon file')
+
+            count: int = int(np.frombuffer(self._mmap, dtype='<u8', count=1, offset=len(MAGIC))[0])
+            coords_offset: int = _HEADER_SIZE + 8 * (count + 1)
+
+            if len(self._mmap) < coords_offset:
+                raise ValueError('Polygon file is truncated or corrupted')
+
+            self._offsets: np.ndarray = np.frombuffer(self._mmap, dtype='<u8', count=count + 1, offset=_HEADER_SIZE)
+
+            if len(self._mmap) != coords_offset + 16 * int(self._offsets[-1]):
+                raise ValueError('Polygon file is truncated or corrupted')
+
+            self._coords: np.ndarray = np.frombuffer(self._mmap, dtype='<f8', offset=coords_offset).reshape(-1, 2)
+
+        except ValueError:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> ConvexPolygon:
+        coords: np.ndarray = self.coords(index)
+
+        if coords.shape[0] < 3:
+            raise ValueError('Number of points must be 3 or greater!')
+
+        return ConvexPolygon._from_sorted_points([Point._make(x, y) for x, y in coords.tolist()])
+
+    def __iter__(self) -> Iterator[ConvexPolygon]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __enter__(self) -> PolygonFile:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+    def coords(self, index: int) -> np.ndarray:
+        '''
+        Returns points of polygon with provided index as read-only (N, 2) array that shares memory with the file.
+
+            Parameters:
+                index: int
+                    index of polygon.
+
+            Returns:
+                np.ndarray:
+                    x and y coordinates of points, counterclockwise.
+        '''
+        if not isinstance(index, int):
+            raise TypeError('Expected an argument type: int')
+
+        if not -len(self) <= index < len(self):
+            raise IndexError('Polygon index out of range')
+
+        index %= len(self)
+
+        return self._coords[int(self._offsets[index]):int(self._offsets[index + 1])]
+
+
+    def close(self) -> None:
+        '''
+        Unmaps the file. Arrays returned by coords have to be released before, otherwise BufferError is raised.
+        '''
+        #Arrays have to be released before mmap can be closed
+        self._offsets = np.zeros(1, dtype='<u8')
+        self._coords = np.zeros((0, 2))
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def load_polygons(path: str) -> PolygonFile:
+    '''
+    Returns memory-mapped polygons from file saved with save_polygons.
+
+        Parameters:
+            path: str
+                path to the file.
+
+        Returns:
+            PolygonFile:
+                lazily loaded polygons.
+    '''
+    return PolygonFile(path)
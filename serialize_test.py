@@ -0,0 +1,71 @@
+import random
+import unittest
+import pytest
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from serialize import save_polygons, load_polygons
+
+
+class SerializeTest(unittest.TestCase):
+
+    @pytest.fixture(autouse=True)
+    def _tmp_path(self, tmp_path):
+        self.path = str(tmp_path / 'polygons.bin')
+
+    def setUp(self):
+        random.seed(16)
+        self.polygons = [
+            ConvexPolygon.from_points_hull([Point(random.uniform(-50.0, 50.0), random.uniform(-50.0, 50.0)) for _ in range(random.randint(3, 40))])
+            for _ in range(20)
+        ]
+
+    def test_serialize_round_trip(self):
+        save_polygons(self.path, self.polygons)
+
+        with load_polygons(self.path) as polygons:
+            self.assertEqual(len(polygons), 20)
+
+            for loaded, polygon in zip(polygons, self.polygons):
+                self.assertEqual([(p.x, p.y) for p in loaded.points], [(p.x, p.y) for p in polygon.points])
+                self.assertEqual(loaded._edges, polygon._edges)
+                self.assertEqual(loaded.contains(Point(0.0, 0.0)), polygon.contains(Point(0.0, 0.0)))
+
+            self.assertEqual(polygons.coords(-1).tolist(), [[p.x, p.y] for p in self.polygons[-1].points])
+
+    def test_serialize_coords_read_only(self):
+        save_polygons(self.path, self.polygons)
+
+        with load_polygons(self.path) as polygons:
+            with pytest.raises(ValueError):
+                polygons.coords(0)[0, 0] = 1.0
+
+    def test_serialize_empty(self):
+        save_polygons(self.path, [])
+
+        with load_polygons(self.path) as polygons:
+            self.assertEqual(list(polygons), [])
+
+    def test_serialize_index_out_of_range(self):
+        save_polygons(self.path, self.polygons)
+
+        with load_polygons(self.path) as polygons:
+            with pytest.raises(IndexError, match='Polygon index out of range'):
+                polygons[20]
+
+    def test_serialize_truncated(self):
+        save_polygons(self.path, self.polygons)
+
+        with open(self.path, 'r+b') as f:
+            f.truncate(100)
+
+        with pytest.raises(ValueError, match='Polygon file is truncated or corrupted'):
+            load_polygons(self.path)
+
+    def test_serialize_not_polygon_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a polygon file')
+
+        with pytest.raises(ValueError, match='Not a polygon file'):
+            load_polygons(self.path)
@@ -0,0 +1,209 @@
+from __future__ import annotations
+import time
+import asyncio
+import numpy as np
+from collections import deque
+from concurrent.futures import Executor
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
+from polygon import Point, ConvexPolygon
+from prepared import PreparedPolygon
+
+
+class BatchingClassifier:
+    '''
+    A class to represent an asyncio front end for point in polygon checks. Concurrent requests are collected into
+    micro-batches that are sent to contains_many when batch reaches maximum size or when the oldest request waited
+    for the batch window, so the event loop is not blocked by checking points one by one.
+
+        Properties:
+
+            max_batch: int
+                maximum number of points in a batch.
+            max_delay: float
+                maximum time in seconds a request waits for its batch to fill.
+
+        Methods:
+
+            contains(point: Point):
+                returns if polygon contains point or not, as a coroutine.
+
+            metrics():
+                returns latency percentiles, batch sizes and queue depth.
+
+            close():
+                checks pending points and waits for running batches to finish.
+    '''
+    def __init__(self, polygon: Union[ConvexPolygon, PreparedPolygon], max_batch: int = 1024, max_delay: float = 0.002, executor: Optional[Executor] = None, history: int = 10000) -> None:
+        '''
+        Constructs the classifier. It has to be used from a single event loop.
+
+            Parameters:
+                polygon: Union[ConvexPolygon, PreparedPolygon]
+                    polygon to check points against.
+                max_batch: int
+                    maximum number of points in a batch.
+                max_delay: float
+                    maximum time in seconds a request waits for its batch to fill.
+                executor: Optional[Executor]
+                    executor batches run in, batches run in the event loop if not provided.
+                history: int
+                    number of latest requests latency percentiles are calculated from.
+        '''
+        if not isinstance(polygon, (ConvexPolygon, PreparedPolygon)):
+            raise TypeError('Expected an argument type: ConvexPolygon or PreparedPolygon')
+
+        if not isinstance(max_batch, int) or max_batch < 1:
+            raise ValueError('Maximum batch size must be 1 or greater!')
+
+        if max_delay < 0:
+            raise ValueError('Maximum delay must not be negative!')
+
+        self._polygon: Union[ConvexPolygon, PreparedPolygon] = polygon
+        self._max_batch: int = max_batch
+        self._max_delay: float = max_delay
+        self._executor: Optional[Executor] = executor
+
+        #Pending requests are (x, y, future, time of request)
+        self._pending: List[Tuple[float, float, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+        self._in_flight: int = 0
+
+        self._latencies: Deque[float] = deque(maxlen=history)
+        self._requests: int = 0
+        self._batches: int = 0
+        self._max_queue_depth: int = 0
+
+    #Getters
+    @property
+    def max_batch(self) -> int:
+        return self._max_batch
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+
+    async def contains(self, point: Point) -> bool:
+        '''
+        Returns if polygon contains provided point or not. Point is checked together with other points requested
+        in the same batch window.
+
+            Parameters:
+                point: Point
+                    point to check.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        self._pending.append((point.x, point.y, future, time.perf_counter()))
+        self._requests += 1
+        self._max_queue_depth = max(self._max_queue_depth, len(self._pending) + self._in_flight)
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+
+        return await future
+
+
+    def _flush(self) -> None:
+        '''
+        Starts a batch from all pending requests.
+        '''
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch: List[Tuple[float, float, asyncio.Future, float]] = self._pending
+        self._pending = []
+        self._in_flight += len(batch)
+
+        task: asyncio.Task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+
+    async def _run_batch(self, batch: List[Tuple[float, float, asyncio.Future, float]]) -> None:
+        '''
+        Checks all points of batch at once and resolves their futures.
+        '''
+        xs: np.ndarray = np.array([request[0] for request in batch])
+        ys: np.ndarray = np.array([request[1] for request in batch])
+
+        try:
+            if self._executor is not None:
+                mask: np.ndarray = await asyncio.get_running_loop().run_in_executor(self._executor, self._polygon.contains_many, xs, ys)
+            else:
+                mask = self._polygon.contains_many(xs, ys)
+
+        except Exception as e:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        finally:
+            self._in_flight -= len(batch)
+            self._batches += 1
+
+        now: float = time.perf_counter()
+        for (_, _, future, start), result in zip(batch, mask.tolist()):
+            #Future is done if request was cancelled
+            if not future.done():
+                future.set_result(result)
+
+            self._latencies.append(now - start)
+
+
+    def metrics(self) -> Dict[str, float]:
+        '''
+        Returns number of requests and batches, mean batch size, current and maximum queue depth and 50th, 95th and
+        99th percentile of latency in seconds of the latest requests.
+
+            Returns:
+                Dict[str, float]:
+                    metrics of the classifier.
+        '''
+        latencies: List[float] = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+
+        return {
+            'requests': self._requests,
+            'batches': self._batches,
+            'mean_batch_size': (self._requests - len(self._pending) - self._in_flight) / self._batches if self._batches else 0.0,
+            'queue_depth': len(self._pending) + self._in_flight,
+            'max_queue_depth': self._max_queue_depth,
+            'latency_p50': percentile(0.50),
+            'latency_p95': percentile(0.95),
+            'latency_p99': percentile(0.99)
+        }
+
+
+    async def close(self) -> None:
+        '''
+        Checks pending points right away and waits for running batches to finish.
+        '''
+        self._flush()
+
+        if self._running:
+            await asyncio.gather(*self._running)
+
+    async def __aenter__(self) -> BatchingClassifier:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,51 @@
+import random
+import asyncio
+import unittest
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from service import BatchingClassifier
+
+
+class BatchingClassifierTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        random.seed(17)
+        self.polygon = ConvexPolygon([Point(0.0, 0.0), Point(10.0, 0.0), Point(10.0, 10.0), Point(0.0, 10.0)])
+        self.points = [Point(random.uniform(-5.0, 15.0), random.uniform(-5.0, 15.0)) for _ in range(1000)]
+
+    async def test_batching_classifier_contains(self):
+        async with BatchingClassifier(self.polygon, max_batch=64) as classifier:
+            results = await asyncio.gather(*(classifier.contains(p) for p in self.points))
+
+        metrics = classifier.metrics()
+
+        self.assertEqual(results, [self.polygon.contains(p) for p in self.points])
+        self.assertEqual(metrics['requests'], 1000)
+        self.assertEqual(metrics['batches'], 16)
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertLessEqual(metrics['latency_p50'], metrics['latency_p99'])
+
+    async def test_batching_classifier_window(self):
+        classifier = BatchingClassifier(self.polygon.prepare(), max_batch=1000, max_delay=0.01)
+        results = await asyncio.gather(*(classifier.contains(p) for p in self.points[:10]))
+
+        self.assertEqual(results, [self.polygon.contains(p) for p in self.points[:10]])
+        self.assertEqual(classifier.metrics()['batches'], 1)
+        self.assertEqual(classifier.metrics()['max_queue_depth'], 10)
+
+    async def test_batching_classifier_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            async with BatchingClassifier(self.polygon, max_batch=100, executor=executor) as classifier:
+                results = await asyncio.gather(*(classifier.contains(p) for p in self.points))
+
+        self.assertEqual(results, [self.polygon.contains(p) for p in self.points])
+
+    async def test_batching_classifier_not_point(self):
+        classifier = BatchingClassifier(self.polygon)
+
+        with pytest.raises(TypeError, match='Expected an argument type: Point'):
+            await classifier.contains((1.0, 1.0))
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Dict, Hashable, List, Optional, Tuple
+from polygon import Point, ConvexPolygon
+
+#Events returned by PointTracker.update
+ENTER: str = 'enter'
+EXIT: str = 'exit'
+
+
+class PointTracker:
+    '''
+    A class to represent tracking of moving points against one convex polygon. For every tracked point it remembers
+    the wedge of the fan from the first point of polygon that its last position was in. Next position is located by
+    walking from that wedge to the neighbouring ones instead of binary search, so points that move little between
+    updates are checked in O(1) time. Results are the same as the ones of ConvexPolygon.contains.
+
+        Properties:
+
+            steps: int
+                number of wedges walked over in all updates.
+
+        Methods:
+
+            update(track_id: Hashable, point: Point):
+                stores new position of point and returns ENTER or EXIT if point entered or left polygon.
+
+            inside(track_id: Hashable):
+                returns if the last position of point is in polygon or not.
+
+            remove(track_id: Hashable):
+                stops tracking point.
+    '''
+    def __init__(self, polygon: ConvexPolygon) -> None:
+        '''
+        Constructs tracker with no tracked points.
+
+            Parameters:
+                polygon: ConvexPolygon
+                    polygon to track points against.
+        '''
+        if not isinstance(polygon, ConvexPolygon):
+            raise TypeError('Expected an argument type: ConvexPolygon')
+
+        self._polygon: ConvexPolygon = polygon
+        #Key is id of point, value is (wedge of the last position, is it in polygon, version of polygon)
+        self._tracks: Dict[Hashable, Tuple[int, bool, int]] = {}
+        self._steps: int = 0
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __contains__(self, track_id: Hashable) -> bool:
+        return track_id in self._tracks
+
+    #Getters
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+
+    def _walk(self, wedge: int, point: Point) -> int:
+        '''
+        Returns wedge of the fan that point is in, walking from provided wedge. Wedge i is between fan vectors i and
+        i + 1, point is in the last wedge whose first fan vector has point on its 'left' side, like in _find_wedge.
+        '''
+        fan: List[Tuple[float, float]] = self._polygon._fan
+        anchor: Point = self._polygon.points[0]
+        last: int = len(fan) - 2
+        dx: float = point.x - anchor.x
+        dy: float = point.y - anchor.y
+        start: int = wedge
+
+        #Walk back while point is on the 'right' side of the first fan vector of the wedge
+        while wedge > 1 and fan[wedge][0] * dy - fan[wedge][1] * dx < 0:
+            wedge -= 1
+
+        #Walk forward while point is on the 'left' side of the next fan vector
+        while wedge < last and fan[wedge + 1][0] * dy - fan[wedge + 1][1] * dx >= 0:
+            wedge += 1
+
+        self._steps += abs(wedge - start)
+
+        return wedge
+
+
+    def update(self, track_id: Hashable, point: Point) -> Optional[str]:
+        '''
+        Stores new position of tracked point and returns if it entered or left polygon. Point that is not tracked yet
+        starts being tracked, it enters polygon if its first position is in polygon. Points are walked from their
+        last wedge, or located with binary search if they are new or points of polygon were replaced.
+
+            Parameters:
+                track_id: Hashable
+                    id of point.
+                point: Point
+                    new position of point.
+
+            Returns:
+                Optional[str]:
+                    ENTER if point entered polygon, EXIT if it left polygon and None otherwise.
+        '''
+        if not isinstance(point, Point):
+            raise TypeError('Expected an argument type: Point')
+
+        polygon: ConvexPolygon = self._polygon
+        track: Optional[Tuple[int, bool, int]] = self._tracks.get(track_id)
+        was_inside: bool = track is not None and track[1]
+
+        min_x, min_y, max_x, max_y = polygon.bounds
+        last: int = len(polygon.points) - 1
+
+        #Point outside of bounding box or outside of the sides of the fan is not in polygon, its wedge is kept
+        if point.x < min_x or point.x > max_x or point.y < min_y or point.y > max_y or \
+                polygon._edge_position(0, point) < 0 or polygon._edge_position(last, point) < 0:
+            is_inside: bool = False
+            wedge: int = track[0] if track is not None and track[2] == polygon.version else 1
+
+        else:
+            if track is None or track[2] != polygon.version:
+                wedge = polygon._find_wedge(point)
+            else:
+                wedge = self._walk(track[0], point)
+
+            #Outer edges of the neighbouring wedges are checked too, like in ConvexPolygon.contains
+            is_inside = polygon._in_wedge(wedge, point)
+
+        self._tracks[track_id] = (wedge, is_inside, polygon.version)
+
+        if is_inside and not was_inside:
+            return ENTER
+
+        if was_inside and not is_inside:
+            return EXIT
+
+        return None
+
+
+    def inside(self, track_id: Hashable) -> bool:
+        '''
+        Returns if the last position of tracked point is in polygon or not.
+
+            Parameters:
+                track_id: Hashable
+                    id of point.
+
+            Returns:
+                bool:
+                    is point in polygon.
+        '''
+        if track_id not in self._tracks:
+            raise KeyError(track_id)
+
+        return self._tracks[track_id][1]
+
+
+    def remove(self, track_id: Hashable) -> None:
+        '''
+        Stops tracking point.
+
+            Parameters:
+                track_id: Hashable
+                    id of point.
+        '''
+        if track_id not in self._tracks:
+            raise KeyError(track_id)
+
+        del self._tracks[track_id]
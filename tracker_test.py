@@ -0,0 +1,86 @@
+import math
+import random
+import unittest
+import pytest
+from polygon import (
+    Point,
+    ConvexPolygon
+)
+from tracker import PointTracker, ENTER, EXIT
+
+
+class PointTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(24)
+        self.polygon = ConvexPolygon([Point(100.0 * math.cos(2 * math.pi * i / 200), 100.0 * math.sin(2 * math.pi * i / 200)) for i in range(200)])
+
+    def test_point_tracker_events(self):
+        tracker = PointTracker(self.polygon)
+
+        self.assertEqual(tracker.update('a', Point(150.0, 0.0)), None)
+        self.assertEqual(tracker.update('a', Point(50.0, 0.0)), ENTER)
+        self.assertEqual(tracker.update('a', Point(0.0, 50.0)), None)
+        self.assertEqual(tracker.update('a', Point(0.0, 150.0)), EXIT)
+        self.assertEqual(tracker.update('b', Point(0.0, 0.0)), ENTER)
+
+        self.assertFalse(tracker.inside('a'))
+        self.assertTrue(tracker.inside('b'))
+        self.assertEqual(len(tracker), 2)
+
+        tracker.remove('a')
+
+        self.assertNotIn('a', tracker)
+
+        with pytest.raises(KeyError):
+            tracker.inside('a')
+
+    def test_point_tracker_moving_points(self):
+        tracker = PointTracker(self.polygon)
+        positions = {i: (random.uniform(-120.0, 120.0), random.uniform(-120.0, 120.0)) for i in range(20)}
+        updates = 0
+
+        for _ in range(200):
+            for i, (x, y) in positions.items():
+                x += random.uniform(-2.0, 2.0)
+                y += random.uniform(-2.0, 2.0)
+                positions[i] = (x, y)
+                was_inside = tracker.inside(i) if i in tracker else False
+                event = tracker.update(i, Point(x, y))
+                updates += 1
+
+                inside = self.polygon.contains(Point(x, y))
+                self.assertEqual(tracker.inside(i), inside)
+                self.assertEqual(event, ENTER if inside and not was_inside else EXIT if was_inside and not inside else None)
+
+        #Points move a little, so they are walked over only a few wedges on average
+        self.assertLess(tracker.steps / updates, 3)
+
+    def test_point_tracker_near_vertex(self):
+        for _ in range(50):
+            polygon = ConvexPolygon.from_points_hull([Point(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(12)])
+            tracker = PointTracker(polygon)
+
+            #Points within 1 ulp of vertices, where float fan check can pick the neighbouring wedge
+            for i, v in enumerate(polygon.points):
+                for dx in (-math.inf, math.inf):
+                    for dy in (-math.inf, math.inf):
+                        p = Point(math.nextafter(v.x, dx), math.nextafter(v.y, dy))
+                        tracker.update('walked', p)
+                        tracker.update((i, dx, dy), p)
+
+                        self.assertEqual(tracker.inside('walked'), polygon.contains(p))
+                        self.assertEqual(tracker.inside((i, dx, dy)), polygon.contains(p))
+
+    def test_point_tracker_polygon_changed(self):
+        tracker = PointTracker(self.polygon)
+        tracker.update('a', Point(0.0, 90.0))
+
+        self.polygon.points = [Point(0.0, 0.0), Point(10.0, 0.0), Point(0.0, 10.0)]
+
+        self.assertEqual(tracker.update('a', Point(0.0, 90.0)), EXIT)
+        self.assertEqual(tracker.update('a', Point(1.0, 1.0)), ENTER)
+
+    def test_point_tracker_not_point(self):
+        with pytest.raises(TypeError, match='Expected an argument type: Point'):
+            PointTracker(self.polygon).update('a', (1.0, 1.0))